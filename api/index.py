@@ -30,26 +30,88 @@ import os
 import re
 import json
 import random
+import time
+import wave
 import asyncio
+import hashlib
+import io
 import logging
-import urllib.request
-import urllib.error
+import logging.handlers
+import queue
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timezone
+# Vercel injects env vars itself — skip the dotenv import/file probe on serverless cold starts
+if not os.environ.get("VERCEL"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import orjson  # C-accelerated JSON; stdlib json is the fallback
 except ImportError:
-    pass
+    orjson = None
 from pathlib import Path
 from typing import Any, Optional, Union
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Header, UploadFile, File, Query
-from fastapi.responses import HTMLResponse, FileResponse, Response
+from fastapi.responses import HTMLResponse, Response, JSONResponse, ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger("honeypot")
+# Logs go through a queue and a background listener thread (run for the app's lifespan)
+# does the write, so an error storm never stalls the event loop on a stream lock. The
+# listener writes through the root logger's handlers, so records are not propagated.
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+def _start_log_listener() -> None:
+    """Drain the log queue into the root handlers (uvicorn/Vercel config), or stderr if none."""
+    global _log_listener
+    handlers = logging.getLogger().handlers
+    if not handlers:
+        stderr = logging.StreamHandler()
+        stderr.setFormatter(logging.Formatter(_LOG_FORMAT))
+        handlers = [stderr]
+    _log_listener = logging.handlers.QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+
+
+def _stop_log_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """Compact JSON encode via orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    """Like _json_dumps but returns UTF-8 bytes ready for an HTTP body (no decode/encode round trip)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """JSON decode via orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 # ═══════════════════════════════════════════════
 # Configuration
@@ -99,9 +161,9 @@ async def get_pool():
                 max_size=10,
                 command_timeout=15,
             )
-            print("[DB] Connection pool created")
+            logger.info("[DB] Connection pool created")
         except Exception as e:
-            print(f"[DB ERROR] Could not connect to PostgreSQL: {e}")
+            logger.error("[DB ERROR] Could not connect to PostgreSQL: %s", e)
             return None
     return _pool
 
@@ -110,7 +172,7 @@ async def init_db():
     """Create tables if they don't exist."""
     pool = await get_pool()
     if not pool:
-        print("[DB] Skipping table creation — no database connection")
+        logger.info("[DB] Skipping table creation — no database connection")
         return
     async with pool.acquire() as conn:
         await conn.execute("""
@@ -155,7 +217,7 @@ async def init_db():
             CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status);
             CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions(started_at DESC);
         """)
-        print("[DB] Tables ready")
+        logger.info("[DB] Tables ready")
 
 
 async def save_session_to_db(session_id: str, session_data: dict, persona: dict):
@@ -179,7 +241,7 @@ async def save_session_to_db(session_id: str, session_data: dict, persona: dict)
                     ended_at = NOW()
             """,
                 session_id,
-                json.dumps(persona),  # asyncpg JSONB accepts pre-serialized JSON strings
+                _json_dumps(persona),  # asyncpg JSONB accepts pre-serialized JSON strings
                 session_data.get("scam_type", "unknown"),
                 session_data.get("scam_confidence", 0.0),
                 session_data.get("turn_count", 0),
@@ -190,22 +252,29 @@ async def save_session_to_db(session_id: str, session_data: dict, persona: dict)
             await conn.execute("DELETE FROM messages WHERE session_id = $1", session_id)
             await conn.execute("DELETE FROM intelligence WHERE session_id = $1", session_id)
 
-            # Insert messages
+            # Insert messages and intelligence as batches (one pipelined executemany each,
+            # instead of a round trip per row)
             history = session_data.get("history", [])
-            for seq, msg in enumerate(history):
-                await conn.execute(
+            if history:
+                await conn.executemany(
                     "INSERT INTO messages (session_id, sender, text, seq) VALUES ($1, $2, $3, $4)",
-                    session_id, msg.get("sender", "unknown"), msg.get("text", ""), seq,
+                    [
+                        (session_id, msg.get("sender", "unknown"), msg.get("text", ""), seq)
+                        for seq, msg in enumerate(history)
+                    ],
                 )
 
-            # Insert intelligence items
             intel_items = session_data.get("intelligence", [])
-            for item in intel_items:
-                await conn.execute(
+            if intel_items:
+                await conn.executemany(
                     "INSERT INTO intelligence (session_id, type, value, confidence) VALUES ($1, $2, $3, $4)",
-                    session_id, item.get("type", ""), item.get("value", ""), item.get("confidence", 0.0),
+                    [
+                        (session_id, item.get("type", ""), item.get("value", ""), item.get("confidence", 0.0))
+                        for item in intel_items
+                    ],
                 )
 
+    _invalidate_admin_stats()
     return True
 
 
@@ -215,53 +284,71 @@ async def save_session_to_db(session_id: str, session_data: dict, persona: dict)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize DB on startup, close pool on shutdown."""
+    """Initialize DB and warm up LLM clients on startup, close pool on shutdown."""
+    _start_log_listener()
     try:
         await init_db()
     except Exception as e:
-        print(f"[DB] Database init skipped (optional): {e}")
+        logger.warning("[DB] Database init skipped (optional): %s", e)
+    warmup = asyncio.create_task(_warmup_groq())
     yield
-    global _pool
+    if not warmup.done():
+        warmup.cancel()
+    if _background_tasks:
+        # Let in-flight session saves finish before the pool goes away
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+    global _pool, _tts_http, _groq_http, _groq_primary, _groq_recovery
+    if _tts_http is not None:
+        await _tts_http.aclose()
+        _tts_http = None
+    if _groq_http is not None:
+        await _groq_http.aclose()
+        _groq_http = _groq_primary = _groq_recovery = None
     if _pool:
         try:
             await _pool.close()
         except Exception:
             pass
         _pool = None
-        print("[DB] Pool closed")
+        logger.info("[DB] Pool closed")
+    _stop_log_listener()
+
+# Serialize endpoint dicts with orjson when it is installed (stdlib json otherwise)
+_DEFAULT_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
 
-app = FastAPI(title="Agentic Honeypot", version="3.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="Agentic Honeypot",
+    version="3.0.0",
+    lifespan=lifespan,
+    default_response_class=_DEFAULT_RESPONSE_CLASS,
+)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
-# In-memory session store (live sessions — flushed to DB on end)
-sessions: dict[str, dict] = {}
+# In-memory session store (live sessions — flushed to DB on end).
+# LRU-ordered and bounded: abandoned sessions (never ended) are evicted oldest-first.
+sessions: "OrderedDict[str, dict]" = OrderedDict()
+_MAX_LIVE_SESSIONS = int(os.environ.get("MAX_LIVE_SESSIONS", "1000"))
 
 # ═══════════════════════════════════════════════
 # Scam Types (LLM-classified dynamically)
 # ═══════════════════════════════════════════════
 
-SCAM_TYPES = [
+SCAM_TYPES = (
     "bank_fraud", "upi_fraud", "kyc_scam", "otp_fraud", "lottery_scam",
     "job_scam", "investment_scam", "crypto_investment", "tech_support",
     "phishing", "refund_scam", "customs_fraud", "insurance_fraud",
     "electricity_scam", "loan_approval", "income_tax", "govt_scheme",
     "threat_scam", "generic",
-]
+)
+_SCAM_TYPE_SET = frozenset(SCAM_TYPES)  # O(1) validation of LLM-returned labels
+_URGENCY_LEVELS = frozenset(("low", "medium", "high", "critical"))
 
 # ═══════════════════════════════════════════════
 # Intelligence Dedup Helper
 # ═══════════════════════════════════════════════
 
-_seen_intel: dict[str, set] = {}  # session_id -> set of seen dedup keys
-_MAX_TRACKED_SESSIONS = 500
-
-
-def _dedup_intel(items: list[dict], session_id: str) -> list[dict]:
-    """Deduplicate intelligence items within a session."""
-    if len(_seen_intel) > _MAX_TRACKED_SESSIONS:
-        for k in list(_seen_intel.keys())[:len(_seen_intel) - _MAX_TRACKED_SESSIONS]:
-            _seen_intel.pop(k, None)
-    seen = _seen_intel.setdefault(session_id, set())
+def _dedup_intel(items: list[dict], seen: set) -> list[dict]:
+    """Deduplicate intelligence items against a session's set of seen keys (updated in place)."""
     unique = []
     for item in items:
         key = f"{item.get('type', '')}:{str(item.get('value', '')).lower()}"
@@ -271,6 +358,48 @@ def _dedup_intel(items: list[dict], session_id: str) -> list[dict]:
     return unique
 
 
+# Evaluation output fields, in response order, and which intel types feed each one
+_INTEL_FIELDS = (
+    "phoneNumbers", "bankAccounts", "upiIds", "phishingLinks",
+    "emailAddresses", "caseIds", "policyNumbers", "orderNumbers",
+)
+_INTEL_FIELD_BY_TYPE = {
+    "phone": "phoneNumbers",
+    "bank_account": "bankAccounts",
+    "ifsc": "bankAccounts",
+    "upi": "upiIds",
+    "url": "phishingLinks",
+    "email": "emailAddresses",
+    "case_id": "caseIds",
+    "reference_id": "caseIds",
+    "policy_number": "policyNumbers",
+    "order_number": "orderNumbers",
+}
+
+
+def _new_intel_buckets() -> dict[str, dict]:
+    """Empty per-field buckets; each is an insertion-ordered dict used as an ordered set."""
+    return {field: {} for field in _INTEL_FIELDS}
+
+
+def _fill_intel_buckets(buckets: dict[str, dict], items: list[dict]) -> None:
+    for item in items:
+        field = _INTEL_FIELD_BY_TYPE.get(item["type"])
+        if field is not None:
+            buckets[field][item["value"]] = None
+
+
+def _bucket_lists(buckets: dict[str, dict]) -> dict[str, list[str]]:
+    return {field: list(values) for field, values in buckets.items()}
+
+
+def _bucket_intel(items: list[dict]) -> dict[str, list[str]]:
+    """Group intel values into evaluation fields in one pass (unique, first-seen order)."""
+    buckets = _new_intel_buckets()
+    _fill_intel_buckets(buckets, items)
+    return _bucket_lists(buckets)
+
+
 # ── Lightweight safety-net: catch obvious data the LLM might miss ──
 # NOTE: email MUST come BEFORE upi so we can exclude email matches from UPI
 _EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", re.I)
@@ -282,6 +411,15 @@ _PHONE_PATTERN = re.compile(
     r"|\b[6-9]\d{4}[\s\-]\d{5}\b"             # 98765-43210 / 98765 43210
     r"|\b[6-9]\d{9}\b"                          # 9876543210
 )
+
+
+def _digits_only(text: str) -> str:
+    """Strip separators from a matched number (same result as re.sub(r"\\D", "", text))."""
+    return text if text.isdecimal() else "".join(filter(str.isdecimal, text))
+
+
+# Amount/fee context right before a long number — it is money, not an account
+_AMOUNT_PREFIX_RE = re.compile(r"(?:rs\.?|inr|₹|rupee|amount|fee|charge|price|cost)\s*$")
 _SAFETY_PATTERNS = [
     ("phone", _PHONE_PATTERN),
     ("email", _EMAIL_PATTERN),
@@ -308,7 +446,7 @@ def _safety_extract(message: str) -> list[dict]:
     # Collect phone matches to exclude them from bank_account
     phone_digits = set()
     for m in _PHONE_PATTERN.finditer(message):
-        digits = re.sub(r'\D', '', m.group(0))
+        digits = _digits_only(m.group(0))
         phone_digits.add(digits[-10:])  # last 10 digits
     
     for intel_type, pattern in _SAFETY_PATTERNS:
@@ -323,17 +461,42 @@ def _safety_extract(message: str) -> list[dict]:
                     continue
             # Skip bank_account matches that are actually phone numbers or small amounts
             if intel_type == "bank_account":
-                digits = re.sub(r'\D', '', val)
-                if digits[-10:] in phone_digits:
+                # \d{11,18} match is already all digits — no stripping needed
+                if val[-10:] in phone_digits:
                     continue
                 # Skip amounts (preceded by Rs/INR/₹) and PINs (4-6 digit context)
                 start = max(0, m.start() - 15)
                 prefix_ctx = message[start:m.start()].lower()
-                if re.search(r'(?:rs\.?|inr|₹|rupee|amount|fee|charge|price|cost)\s*$', prefix_ctx):
+                if _AMOUNT_PREFIX_RE.search(prefix_ctx):
                     continue
             items.append({"type": intel_type, "value": val, "confidence": 0.75})
     return items
 
+
+def _safety_extract_many(messages: list[str]) -> list[list[dict]]:
+    """Run _safety_extract over several messages (one worker-thread hop for all of them)."""
+    return [_safety_extract(m) for m in messages]
+
+# ── Red-flag patterns (compiled once; scanned over all scammer text each turn) ──
+_RED_FLAG_PATTERNS = tuple((label, re.compile(pattern, re.I)) for label, pattern in (
+    ("Urgency/time pressure tactics", r"(?:urgent|immediately|right\s*now|hurry|quick|fast|within\s*\d|last\s*chance|expire|deadline|limited\s*time|act\s*now|don.t\s*delay)"),
+    ("OTP/credential request", r"(?:otp|one\s*time\s*password|verification\s*code|cvv|pin\s*number|password|credential|secret\s*code)"),
+    ("Account block/freeze threat", r"(?:block|freeze|suspend|disconnect|deactivat|cancel|terminat|restrict|disable|locked|hold\s*your\s*account)"),
+    ("Legal/arrest threat", r"(?:legal\s*action|arrest|police|court|warrant|cbi|summon|prosecut|jail|penalty|fine\s*of|imprisonment)"),
+    ("Too-good-to-be-true offer", r"(?:congratulat|won|winner|prize|reward|cashback|guaranteed\s*return|100\s*%|free\s*gift|selected|lucky|jackpot|bonus)"),
+    ("Suspicious link/download", r"(?:click.*(?:link|here|below)|download|install|visit\s*(?:this|our)|verify.*(?:link|url)|\.fake|amaz0n|http)"),
+    ("Request for sensitive data", r"(?:share.*(?:account|aadhaar|pan|otp|bank)|send.*(?:money|amount|payment)|provide.*(?:detail|number|info))"),
+    ("Unsolicited contact", r"(?:calling\s*from|this\s*is\s*(?:from|the)|we\s*(?:are|have)\s*(?:from|noticed)|your\s*(?:account|application|policy|order)\s*(?:has|is|was))"),
+    ("Upfront fee/payment demand", r"(?:processing\s*fee|registration\s*fee|advance\s*payment|pay.*(?:first|now|immediate)|transfer.*(?:amount|fee)|service\s*charge|tax\s*payment)"),
+    ("Impersonation of authority", r"(?:(?:from|calling)\s*(?:sbi|rbi|police|income\s*tax|customs|microsoft|amazon|paytm|government|ministry)|official|authorized|certified|department|division|officer)"),
+))
+
+
+def _detect_red_flags(text: str) -> list[str]:
+    """Labels of every red-flag pattern present in the text, in pattern order."""
+    return [label for label, regex in _RED_FLAG_PATTERNS if regex.search(text)]
+
+
 # ═══════════════════════════════════════════════
 # LLM Client — Dynamic Classification & Response
 # ═══════════════════════════════════════════════
@@ -435,30 +598,67 @@ CRITICAL RULES:
 
 _groq_primary = None
 _groq_recovery = None
+_groq_http = None  # one pooled httpx.AsyncClient shared by both keys (same host)
+
+
+def _get_groq_http():
+    """Shared keep-alive connection pool to api.groq.com for chat and Whisper calls."""
+    global _groq_http
+    if _groq_http is None:
+        import httpx
+        _groq_http = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=5.0),  # chat calls pass a tighter per-request timeout
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=300.0),
+        )
+    return _groq_http
 
 
 def _get_groq_clients() -> list:
-    """Return list of available Groq clients [primary, recovery]."""
+    """Return list of available async Groq clients [primary, recovery].
+
+    SDK retries are disabled — generate_llm_response runs its own fallback
+    chain across keys/models and must stay within its global deadline.
+    """
     global _groq_primary, _groq_recovery
-    from groq import Groq
+    from groq import AsyncGroq
     clients = []
     if GROQ_API_KEY:
         if _groq_primary is None:
-            _groq_primary = Groq(api_key=GROQ_API_KEY)
+            _groq_primary = AsyncGroq(api_key=GROQ_API_KEY, max_retries=0, http_client=_get_groq_http())
         clients.append(_groq_primary)
     if RECOVERY_KEY and RECOVERY_KEY != GROQ_API_KEY:
         if _groq_recovery is None:
-            _groq_recovery = Groq(api_key=RECOVERY_KEY)
+            _groq_recovery = AsyncGroq(api_key=RECOVERY_KEY, max_retries=0, http_client=_get_groq_http())
         clients.append(_groq_recovery)
     return clients
 
 
+async def _warmup_groq() -> None:
+    """Build the Groq clients and open their connections before the first scammer message.
+
+    Issues a cheap models.list() per client so DNS + TLS are paid at startup,
+    not on the first turn. Best-effort — failures are logged and ignored.
+    """
+    try:
+        clients = _get_groq_clients()
+    except Exception as e:
+        logger.warning("[LLM] Warmup skipped: %s", e)
+        return
+    for client in clients:
+        try:
+            await client.models.list()
+        except Exception as e:
+            logger.warning("[LLM] Warmup request failed (non-fatal): %s", e)
+    if clients:
+        logger.info("[LLM] Warmed up %d Groq client(s)", len(clients))
+
+
 # ── Fallback Responses (used when ALL LLM keys are exhausted) ──
 # ALL responses MUST end with a question mark (?) — scoring requires it.
 # Large pools per phase prevent repetition across 10-turn evaluations.
 # Each response is designed to EXTRACT a specific data type from the scammer.
 
-_FALLBACK_EARLY = [
+_FALLBACK_EARLY = (
     "Hello? Who is this calling?",
     "Oh, what happened? Can you tell me more?",
     "Really? That sounds serious, what should I do?",
@@ -474,9 +674,9 @@ _FALLBACK_EARLY = [
     "Haan haan, I'm listening carefully, but first can you tell me your good name?",
     "Oh my god really?! My wife was just talking about something like this, what organization are you from?",
     "Bilkul sir, I want to cooperate fully, which department exactly are you calling from?",
-]
+)
 
-_FALLBACK_MID = [
+_FALLBACK_MID = (
     "Ok ok, can you tell me your good name please?",
     "Which department are you calling from sir?",
     "I see I see, so what should I do now?",
@@ -493,9 +693,9 @@ _FALLBACK_MID = [
     "Theek hai sir, I will do whatever you say, but what is your direct phone number in case call drops?",
     "Haan I want to help, can you tell me the case number or file number for this?",
     "Ok sir one second, which website should I go to for this?",
-]
+)
 
-_FALLBACK_LATE = [
+_FALLBACK_LATE = (
     "Ok I'm trying, what UPI ID should I send to?",
     "Let me note that account number, can you repeat it once more?",
     "The app is loading very slowly today, what number should I enter?",
@@ -516,7 +716,28 @@ _FALLBACK_LATE = [
     "Ok sir I clicked the link but it's showing some page, can you send the link again?",
     "My app shows different UPI options, which one is yours again?",
     "Sir I'm on the website now, it's asking for policy number, what should I type?",
-]
+)
+
+# Indexed by conversation phase (0=early, 1=mid, 2=late); the combined pool is
+# the cross-phase overflow used once a phase's replies are exhausted.
+_FALLBACK_POOLS = (_FALLBACK_EARLY, _FALLBACK_MID, _FALLBACK_LATE)
+_FALLBACK_ALL = _FALLBACK_EARLY + _FALLBACK_MID + _FALLBACK_LATE
+# Phase by scammer turn count: 0-1 → early, 2-4 → mid, 5+ → late
+_PHASE_BY_TURN = (0, 0, 1, 1, 1)
+
+
+_AGENT_SENDERS = frozenset(("agent", "user"))
+
+
+def _history_columns(history: list[dict]) -> tuple[list[str], list[str]]:
+    """Split history dicts into parallel (senders, texts) columns for cheap filtering."""
+    return [m.get("sender", "") for m in history], [m.get("text", "") for m in history]
+
+
+def _scammer_texts(history: list[dict]) -> list[str]:
+    """Texts of scammer turns, in conversation order."""
+    senders, texts = _history_columns(history)
+    return [t for s, t in zip(senders, texts) if s == "scammer"]
 
 
 def _rule_based_fallback(scammer_message: str, history: list[dict]) -> str:
@@ -525,26 +746,22 @@ def _rule_based_fallback(scammer_message: str, history: list[dict]) -> str:
     Uses conversation phase (early/mid/late) and deduplication against all
     previous honeypot messages to prevent repetition across turns.
     """
-    turn_count = len([m for m in history if m.get("sender") in ("scammer", "user")])
-    if turn_count <= 1:
-        responses = _FALLBACK_EARLY
-    elif turn_count <= 4:
-        responses = _FALLBACK_MID
-    else:
-        responses = _FALLBACK_LATE
+    senders, texts = _history_columns(history)
+    turn_count = senders.count("scammer") + senders.count("user")
+    phase = _PHASE_BY_TURN[turn_count] if turn_count < len(_PHASE_BY_TURN) else 2
+    responses = _FALLBACK_POOLS[phase]
+
+    # Nothing to dedup against before the first honeypot reply — skip the set build
+    if not _AGENT_SENDERS.intersection(senders):
+        return random.choice(responses)
 
     # Dedup: collect ALL previous honeypot responses from history
     # Evaluator uses sender="user" for honeypot, internal uses sender="agent"
-    prev_agent_texts = set(
-        m.get("text", "").strip()
-        for m in history
-        if m.get("sender") in ("agent", "user")
-    )
+    prev_agent_texts = {t.strip() for s, t in zip(senders, texts) if s in _AGENT_SENDERS}
     available = [r for r in responses if r not in prev_agent_texts]
     if not available:
         # All exhausted — pull from ALL pools to avoid repetition
-        all_responses = _FALLBACK_EARLY + _FALLBACK_MID + _FALLBACK_LATE
-        available = [r for r in all_responses if r not in prev_agent_texts]
+        available = [r for r in _FALLBACK_ALL if r not in prev_agent_texts]
     if not available:
         available = responses  # absolute last resort
     return random.choice(available)
@@ -572,6 +789,8 @@ _SCAM_KEYWORDS = {
     "govt_scheme": r"\b(?:government|govt|yojana|scheme|subsidy|ministry|pm\s*(?:awas|kisan|mudra|jan\s*dhan)|digital\s*india|benefit|ayushman|ujjwala|swachh|atal|sukanya|kisan\s*(?:samman|credit)|ration\s*card|aadhar\s*(?:link|seed)|jan\s*(?:dhan|aushadhi)|direct\s*benefit|dbt)\b",
     "threat_scam": r"\b(?:arrest|warrant|legal\s*action|court|summon|fir\s*(?:filed|registered)|prosecut|imprison|cbi\s*(?:involved|officer|case)|narcotics|money\s*laundering|cyber\s*(?:crime|cell)|ed\s*(?:notice|raid)|enforcement\s*directorate|police\s*(?:station|complaint)|jail|bail|anticipatory)\b",
 }
+# Compiled once at import — the classifier runs on every fallback turn
+_SCAM_KEYWORD_RES = tuple((scam_type, re.compile(pattern, re.I)) for scam_type, pattern in _SCAM_KEYWORDS.items())
 
 
 def _classify_scam_keywords(text: str) -> tuple[str, float]:
@@ -579,8 +798,8 @@ def _classify_scam_keywords(text: str) -> tuple[str, float]:
     Returns (scam_type, confidence)."""
     text_lower = text.lower()
     scores: dict[str, int] = {}
-    for scam_type, pattern in _SCAM_KEYWORDS.items():
-        matches = re.findall(pattern, text_lower, re.I)
+    for scam_type, regex in _SCAM_KEYWORD_RES:
+        matches = regex.findall(text_lower)
         if matches:
             scores[scam_type] = len(matches)
     if not scores:
@@ -590,25 +809,13 @@ def _classify_scam_keywords(text: str) -> tuple[str, float]:
     return (best, confidence)
 
 
-async def generate_llm_response(
-    scammer_message: str,
-    conversation_history: list[dict],
-    persona: dict,
-    current_scam_type: str = "unknown",
-) -> dict:
-    """Single LLM call: generate reply + classify scam + extract intelligence.
-    Returns: {"reply": str, "scamType": str, "confidence": float, "urgency": str, "extractedData": dict}
-    """
-    clients = _get_groq_clients()
-    system_prompt = _build_persona_prompt(persona or {})
-
-    scam_types_str = ", ".join(SCAM_TYPES)
-
-    classification_instruction = f"""You MUST respond with VALID JSON only. No text outside the JSON.
+# Static JSON contract appended to every system prompt — built once at import,
+# so it is identical across requests and sits in the cacheable prompt prefix.
+_CLASSIFICATION_INSTRUCTION = f"""You MUST respond with VALID JSON only. No text outside the JSON.
 
 {{
   "reply": "your conversational response as the persona (1-3 sentences, warm, casual, trusting, MUST end with a question that asks for a specific piece of data you haven't gotten yet)",
-  "scamType": "one of: {scam_types_str}",
+  "scamType": "one of: {", ".join(SCAM_TYPES)}",
   "confidence": 0.0 to 1.0,
   "urgency": "low|medium|high|critical",
   "extractedData": {{
@@ -636,24 +843,94 @@ EXTRACTION RULES:
 - Include PAN card numbers (ABCDE1234F format) in caseIds.
 - Only extract data from the CALLER's current message, not your own reply."""
 
+
+@lru_cache(maxsize=32)
+def _replay_tail(scam_type: str) -> str:
+    """Pre-encoded constant fields of a replayed assistant turn (everything after "reply")."""
+    return "," + _json_dumps(
+        {"scamType": scam_type, "confidence": 0.7, "urgency": "medium", "extractedData": {}}
+    )[1:]
+
+
+# Persona fields that _build_persona_prompt reads — the system message is a pure
+# function of these, so it is built once per distinct persona and then reused.
+# Each entry is ~8KB of text; deployments use a handful of personas, so keep the cap small.
+_PERSONA_PROMPT_KEYS = ("name", "age", "occupation", "location", "bank", "gender", "language")
+
+
+@lru_cache(maxsize=32)
+def _cached_system_message(fields: tuple) -> str:
+    p = {k: v for k, v in zip(_PERSONA_PROMPT_KEYS, fields) if v is not None}
+    return _build_persona_prompt(p) + "\n\n" + _CLASSIFICATION_INSTRUCTION
+
+
+def _system_message(persona: dict) -> str:
+    """Persona prompt + classification instruction, cached per persona."""
+    fields = tuple(persona.get(k) for k in _PERSONA_PROMPT_KEYS)
+    try:
+        return _cached_system_message(fields)
+    except TypeError:  # unhashable persona value from the request — build uncached
+        return _build_persona_prompt(persona) + "\n\n" + _CLASSIFICATION_INSTRUCTION
+
+
+# Output budget: the reply is 1-3 sentences, but the JSON envelope carries the
+# full extractedData schema. Messages with no identifier-like content only need
+# room for the reply plus empty arrays; data-bearing messages keep the full budget.
+_MAX_TOKENS_PLAIN = 200
+_MAX_TOKENS_WITH_DATA = 250
+_DATA_HINT_RE = re.compile(r"\d{4}|@|https?://|www\.|\.(?:ly|in|com)/", re.IGNORECASE)
+
+
+def _max_tokens_for(scammer_message: str) -> int:
+    """Pick the completion token cap for this turn."""
+    if _DATA_HINT_RE.search(scammer_message):
+        return _MAX_TOKENS_WITH_DATA
+    return _MAX_TOKENS_PLAIN
+
+
+# Exact-match cache of successful LLM results, keyed on the full prompt (system +
+# replayed history + current message). Replayed/retried conversations get the
+# same answer instantly; a new turn always misses because its history differs.
+_LLM_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+_LLM_CACHE_MAX = 512
+
+
+def _llm_cache_key(messages: list[dict], max_tokens: int) -> str:
+    return hashlib.sha256(f"{max_tokens}|{_json_dumps(messages)}".encode("utf-8")).hexdigest()
+
+
+async def generate_llm_response(
+    scammer_message: str,
+    conversation_history: list[dict],
+    persona: dict,
+    current_scam_type: str = "unknown",
+) -> dict:
+    """Single LLM call: generate reply + classify scam + extract intelligence.
+    Returns: {"reply": str, "scamType": str, "confidence": float, "urgency": str, "extractedData": dict}
+    """
+    clients = _get_groq_clients()
+
     messages = [
-        {"role": "system", "content": system_prompt + "\n\n" + classification_instruction},
+        {"role": "system", "content": _system_message(persona or {})},
     ]
 
     # Include last 6 conversation messages for better context (balanced for rate limits)
+    # Replayed agent turns use compact separators — the schema is already in the system prompt.
+    # Only the reply text is encoded per turn; the constant fields are spliced in pre-encoded.
+    replay_tail = _replay_tail(current_scam_type)
     for msg in conversation_history[-6:]:
         role = "assistant" if msg.get("sender") in ("user", "agent") else "user"
         text = msg.get("text", "")
         if role == "assistant":
-            text = json.dumps({"reply": text, "scamType": current_scam_type, "confidence": 0.7, "urgency": "medium", "extractedData": {}})
+            text = '{"reply":' + _json_dumps(text) + replay_tail
         messages.append({"role": role, "content": text})
 
     messages.append({"role": "user", "content": scammer_message})
 
     # No clients available at all
     if not clients:
-        print("[LLM] No API keys configured — using fallback")
-        all_text = scammer_message + " " + " ".join(m.get("text", "") for m in conversation_history if m.get("sender") in ("scammer",))
+        logger.warning("[LLM] No API keys configured — using fallback")
+        all_text = scammer_message + " " + " ".join(_scammer_texts(conversation_history))
         fb_type, fb_conf = _classify_scam_keywords(all_text)
         if current_scam_type not in ("unknown", "generic"):
             fb_type = current_scam_type
@@ -681,6 +958,15 @@ EXTRACTION RULES:
     for client in clients:
         fallback_chain.append((client, LLM_FALLBACK_MODEL, min(LLM_TIMEOUT, 8)))
 
+    max_tokens = _max_tokens_for(scammer_message)
+
+    cache_key = _llm_cache_key(messages, max_tokens)
+    cached = _LLM_CACHE.get(cache_key)
+    if cached is not None:
+        _LLM_CACHE.move_to_end(cache_key)
+        logger.info("[LLM] Cache hit")
+        return {**cached, "extractedData": dict(cached["extractedData"])}
+
     _call_start = asyncio.get_event_loop().time()
     _GLOBAL_DEADLINE = 24.0  # Never exceed 24s total (30s API timeout - buffer)
     _last_429_time = 0.0  # Track when we last hit a rate limit
@@ -699,20 +985,19 @@ EXTRACTION RULES:
                 await asyncio.sleep(wait_time)
 
         try:
-            completion = await asyncio.wait_for(
-                asyncio.to_thread(
-                    client.chat.completions.create,
-                    model=model,
-                    messages=messages,
-                    temperature=0.85,
-                    max_tokens=250,
-                    top_p=0.95,
-                    response_format={"type": "json_object"},
-                ),
+            # Timeout is enforced by the HTTP transport: on expiry the request is
+            # actually aborted and the connection released (no orphaned thread).
+            completion = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=0.85,
+                max_tokens=max_tokens,
+                top_p=0.95,
+                response_format={"type": "json_object"},
                 timeout=actual_timeout,
             )
             raw = (completion.choices[0].message.content or "").strip()
-            result = json.loads(raw)
+            result = _json_loads(raw)
             reply = str(result.get("reply", "")).strip()
 
             if not reply:
@@ -727,38 +1012,42 @@ EXTRACTION RULES:
                 raise ValueError("AI identity leak")
 
             scam_type = str(result.get("scamType", "generic"))
-            if scam_type not in SCAM_TYPES:
+            if scam_type not in _SCAM_TYPE_SET:
                 scam_type = "generic"
             confidence = max(0.0, min(1.0, float(result.get("confidence", 0.7))))
             urgency = str(result.get("urgency", "medium"))
-            if urgency not in ("low", "medium", "high", "critical"):
+            if urgency not in _URGENCY_LEVELS:
                 urgency = "medium"
 
             extracted = result.get("extractedData", {})
             if not isinstance(extracted, dict):
                 extracted = {}
 
-            return {
+            llm_result = {
                 "reply": reply,
                 "scamType": scam_type,
                 "confidence": confidence,
                 "urgency": urgency,
                 "extractedData": extracted,
             }
+            _LLM_CACHE[cache_key] = llm_result
+            if len(_LLM_CACHE) > _LLM_CACHE_MAX:
+                _LLM_CACHE.popitem(last=False)
+            return {**llm_result, "extractedData": dict(extracted)}
 
         except Exception as e:
             err_str = str(e).lower()
             key_label = 'primary' if client == _groq_primary else 'recovery'
             if "rate_limit" in err_str or "429" in err_str:
                 _last_429_time = asyncio.get_event_loop().time()
-                print(f"[LLM] 429 on {model} ({key_label}), moving to next in chain...")
+                logger.warning("[LLM] 429 on %s (%s), moving to next in chain...", model, key_label)
             else:
-                print(f"[LLM ERROR] {model} ({key_label}): {e}")
+                logger.error("[LLM ERROR] %s (%s): %s", model, key_label, e)
             continue  # move to next fallback chain entry
 
     # All clients × all models failed
-    print("[LLM] All keys+models failed — using rule-based fallback")
-    all_text = scammer_message + " " + " ".join(m.get("text", "") for m in conversation_history if m.get("sender") in ("scammer",))
+    logger.warning("[LLM] All keys+models failed — using rule-based fallback")
+    all_text = scammer_message + " " + " ".join(_scammer_texts(conversation_history))
     fb_type, fb_conf = _classify_scam_keywords(all_text)
     if current_scam_type not in ("unknown", "generic"):
         fb_type = current_scam_type
@@ -794,31 +1083,106 @@ class HoneypotRequest(BaseModel):
 # ═══════════════════════════════════════════════
 
 def get_session(session_id: str) -> dict:
-    """Get or create an in-memory session for the given session ID."""
-    if session_id not in sessions:
-        sessions[session_id] = {
-            "history": [],
-            "intelligence": [],
-            "scam_confidence": 0.0,
-            "scam_type": "unknown",
-            "turn_count": 0,
-            "started_at": datetime.now(timezone.utc),
-            "persona": {},
-        }
-    return sessions[session_id]
+    """Get or create an in-memory session for the given session ID (marks it most recently used)."""
+    session = sessions.get(session_id)
+    if session is not None:
+        sessions.move_to_end(session_id)
+        return session
+    session = sessions[session_id] = {
+        "history": [],
+        "intelligence": [],
+        "intel_buckets": _new_intel_buckets(),  # maintained incrementally by _record_intel
+        "seen_intel": set(),  # dedup keys — lives and dies with the session
+        "scammer_texts_lower": [],  # lowercased scammer turns, appended as history grows
+        "scam_confidence": 0.0,
+        "scam_type": "unknown",
+        "turn_count": 0,
+        "started_at": datetime.now(timezone.utc),
+        "persona": {},
+    }
+    while len(sessions) > _MAX_LIVE_SESSIONS:
+        evicted_id, evicted = sessions.popitem(last=False)
+        logger.info("[SESSION] Evicted idle session %s (live cap %d)", evicted_id, _MAX_LIVE_SESSIONS)
+        if _pool is not None and evicted.get("history"):
+            # Persist off the request path — the turn that triggered eviction must not wait on the DB
+            _spawn_background(_persist_evicted_session(evicted_id, evicted))
+    return session
+
+
+def _record_intel(session: dict, items: list[dict]) -> None:
+    """Append (already deduplicated) intel items to the session and its evaluation buckets."""
+    session["intelligence"].extend(items)
+    _fill_intel_buckets(session["intel_buckets"], items)
+
+
+# Strong references to in-flight fire-and-forget tasks (the loop only keeps weak ones)
+_background_tasks: set = set()
+
+
+def _spawn_background(coro) -> None:
+    """Schedule a coroutine without awaiting it; errors are the coroutine's own concern."""
+    task = asyncio.get_running_loop().create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _persist_evicted_session(session_id: str, session: dict):
+    """Save an evicted session so abandoned conversations still reach the admin dashboard."""
+    try:
+        await save_session_to_db(session_id, session, session.get("persona", {}))
+        logger.info("[DB] Saved evicted session %s", session_id)
+    except Exception as e:
+        logger.error("[DB ERROR] Could not save evicted session %s: %s", session_id, e)
 
 # ═══════════════════════════════════════════════
 # API Endpoints
 # ═══════════════════════════════════════════════
 
+# Frontend pages are read once at import and served from memory — no disk access
+# per request. A content-hash ETag lets browsers revalidate with a bodyless 304.
+_FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
+_PAGE_CACHE_CONTROL = "public, max-age=60"
+
+
+def _load_frontend_page(name: str) -> Optional[tuple[bytes, str]]:
+    path = _FRONTEND_DIR / name
+    if not path.is_file():
+        return None
+    body = path.read_bytes()
+    return body, f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check: a list of entity tags or "*", compared weakly (RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _page_response(page: tuple[bytes, str], if_none_match: Optional[str]) -> Response:
+    body, etag = page
+    headers = {"ETag": etag, "Cache-Control": _PAGE_CACHE_CONTROL}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
+_INDEX_PAGE = _load_frontend_page("index.html")
+_ADMIN_PAGE = _load_frontend_page("admin.html")
+_ROOT_FALLBACK_HTML = "<h1>Agentic Honeypot</h1><p>POST /api/honeypot or /api/voice/detect</p>"
+_ADMIN_FALLBACK_HTML = "<h1>Admin page not found</h1><p>Place admin.html in frontend/</p>"
+
+
 @app.get("/")
-async def root():
+async def root(if_none_match: Optional[str] = Header(None)):
     # Serve the frontend chat UI
-    base = Path(__file__).resolve().parent.parent
-    html_path = base / "frontend" / "index.html"
-    if html_path.exists():
-        return FileResponse(html_path, media_type="text/html")
-    return HTMLResponse("<h1>Agentic Honeypot</h1><p>POST /api/honeypot or /api/voice/detect</p>")
+    if _INDEX_PAGE:
+        return _page_response(_INDEX_PAGE, if_none_match)
+    return HTMLResponse(_ROOT_FALLBACK_HTML)
 
 
 @app.get("/health")
@@ -827,6 +1191,59 @@ async def health():
     return {"status": "ok", "groq": bool(GROQ_API_KEY), "database": db_ok}
 
 
+# Emergency-path agent notes: fixed text with holes for scam type, confidence and
+# the per-field counts (in _INTEL_FIELDS order), formatted without f-string rebuilds.
+_EMERGENCY_NOTES_TEMPLATE = (
+    "Emergency fallback response. Scam type: {} (confidence: {}). "
+    "Red flags identified: urgency/time pressure tactics, unsolicited contact from unknown party, "
+    "request for sensitive data (account/OTP/credentials), impersonation of authority figure, "
+    "potential phishing attempt, suspicious payment/fee demand. "
+    "Extracted: {} phone numbers, {} bank accounts, {} UPI IDs, {} links, {} emails, "
+    "{} case IDs, {} policy numbers, {} order numbers. "
+    "The scammer used social engineering tactics including urgency and fear, identity impersonation, "
+    "requests for sensitive data, and deceptive communication."
+)
+
+
+def _build_honeypot_response(
+    *,
+    session_id: str,
+    reply: str,
+    scam_detected: bool,
+    scam_type: str,
+    confidence: float,
+    total_messages: int,
+    duration_seconds: float,
+    extracted_intel: dict[str, list[str]],
+    agent_notes: str,
+    urgency: str,
+) -> dict:
+    """Evaluation-compatible response body — one layout shared by the normal and emergency paths."""
+    duration = round(duration_seconds, 2)
+    return {
+        "status": "success",
+        "sessionId": session_id,
+        "reply": reply,
+        "scamDetected": scam_detected,
+        "scamType": scam_type,
+        "confidenceLevel": confidence,
+        "totalMessagesExchanged": total_messages,
+        "engagementDurationSeconds": duration,
+        "extractedIntelligence": extracted_intel,
+        "engagementMetrics": {
+            "engagementDurationSeconds": duration,
+            "totalMessagesExchanged": total_messages,
+        },
+        "agentNotes": agent_notes,
+        "analysis": {
+            "is_scam": scam_detected,
+            "scam_confidence": confidence,
+            "scam_type": scam_type,
+            "urgency_level": urgency,
+        },
+    }
+
+
 @app.post("/api/honeypot")
 async def honeypot_endpoint(req: HoneypotRequest, x_api_key: str = Header(None)):
     """Process scam message and return honeypot response. Guaranteed to never fail."""
@@ -836,7 +1253,7 @@ async def honeypot_endpoint(req: HoneypotRequest, x_api_key: str = Header(None))
         raise  # Let 400/401 through
     except Exception as e:
         # SAFETY NET: If ANYTHING crashes, return a valid response anyway
-        print(f"[CRITICAL FALLBACK] honeypot_endpoint crashed: {e}")
+        logger.exception("[CRITICAL FALLBACK] honeypot_endpoint crashed: %s", e)
         session_id = req.sessionId or "default"
         message_text = req.message.text or ""
         fallback_reply = _rule_based_fallback(message_text, req.conversationHistory or [])
@@ -844,54 +1261,26 @@ async def honeypot_endpoint(req: HoneypotRequest, x_api_key: str = Header(None))
         fallback_duration = max(msg_count * 15.0, 65.0)
         # Extract intelligence from full history even in fallback
         fallback_intel = []
-        for hist_msg in (req.conversationHistory or []):
-            if hist_msg.get("sender") in ("scammer",):
-                fallback_intel.extend(_safety_extract(hist_msg.get("text", "")))
+        scammer_texts = _scammer_texts(req.conversationHistory or [])
+        for text in scammer_texts:
+            fallback_intel.extend(_safety_extract(text))
         fallback_intel.extend(_safety_extract(message_text))
-        fb_phones = list({i["value"] for i in fallback_intel if i["type"] == "phone"})
-        fb_accounts = list({i["value"] for i in fallback_intel if i["type"] in ("bank_account", "ifsc")})
-        fb_upis = list({i["value"] for i in fallback_intel if i["type"] == "upi"})
-        fb_urls = list({i["value"] for i in fallback_intel if i["type"] == "url"})
-        fb_emails = list({i["value"] for i in fallback_intel if i["type"] == "email"})
-        fb_cases = list({i["value"] for i in fallback_intel if i["type"] in ("case_id", "reference_id")})
-        fb_policies = list({i["value"] for i in fallback_intel if i["type"] == "policy_number"})
-        fb_orders = list({i["value"] for i in fallback_intel if i["type"] == "order_number"})
+        fb_intel = _bucket_intel(fallback_intel)
         # Classify scam type from conversation text even in emergency fallback
-        all_text = message_text + " " + " ".join(
-            m.get("text", "") for m in (req.conversationHistory or []) if m.get("sender") in ("scammer",)
-        )
+        all_text = message_text + " " + " ".join(scammer_texts)
         fb_scam_type, fb_conf = _classify_scam_keywords(all_text)
-        return {
-            "status": "success",
-            "sessionId": session_id,
-            "reply": fallback_reply,
-            "scamDetected": True,
-            "scamType": fb_scam_type,
-            "confidenceLevel": fb_conf,
-            "totalMessagesExchanged": msg_count,
-            "engagementDurationSeconds": round(fallback_duration, 2),
-            "extractedIntelligence": {
-                "phoneNumbers": fb_phones,
-                "bankAccounts": fb_accounts,
-                "upiIds": fb_upis,
-                "phishingLinks": fb_urls,
-                "emailAddresses": fb_emails,
-                "caseIds": fb_cases,
-                "policyNumbers": fb_policies,
-                "orderNumbers": fb_orders,
-            },
-            "engagementMetrics": {
-                "engagementDurationSeconds": round(fallback_duration, 2),
-                "totalMessagesExchanged": msg_count,
-            },
-            "agentNotes": f"Emergency fallback response. Scam type: {fb_scam_type} (confidence: {fb_conf}). Red flags identified: urgency/time pressure tactics, unsolicited contact from unknown party, request for sensitive data (account/OTP/credentials), impersonation of authority figure, potential phishing attempt, suspicious payment/fee demand. Extracted: {len(fb_phones)} phone numbers, {len(fb_accounts)} bank accounts, {len(fb_upis)} UPI IDs, {len(fb_urls)} links, {len(fb_emails)} emails, {len(fb_cases)} case IDs, {len(fb_policies)} policy numbers, {len(fb_orders)} order numbers. The scammer used social engineering tactics including urgency and fear, identity impersonation, requests for sensitive data, and deceptive communication.",
-            "analysis": {
-                "is_scam": True,
-                "scam_confidence": fb_conf,
-                "scam_type": fb_scam_type,
-                "urgency_level": "medium",
-            },
-        }
+        return _build_honeypot_response(
+            session_id=session_id,
+            reply=fallback_reply,
+            scam_detected=True,
+            scam_type=fb_scam_type,
+            confidence=fb_conf,
+            total_messages=msg_count,
+            duration_seconds=fallback_duration,
+            extracted_intel=fb_intel,
+            urgency="medium",
+            agent_notes=_EMERGENCY_NOTES_TEMPLATE.format(fb_scam_type, fb_conf, *map(len, fb_intel.values())),
+        )
 
 
 async def _honeypot_core(req: HoneypotRequest, x_api_key: str = None):
@@ -922,13 +1311,24 @@ async def _honeypot_core(req: HoneypotRequest, x_api_key: str = None):
         if "channel" in req.metadata:
             persona["_channel"] = req.metadata["channel"]
 
-    # 1. Single LLM call: response + classification + intelligence extraction
-    llm_result = await generate_llm_response(
+    # 1. Single LLM call: response + classification + intelligence extraction.
+    # The regex safety-net (current message + full history) runs in a worker thread
+    # while the LLM request is in flight; results are merged after it in the usual order.
+    hist_scammer_texts = _scammer_texts(history)
+    llm_task = asyncio.create_task(generate_llm_response(
         scammer_message=message_text,
         conversation_history=history,
         persona=persona,
         current_scam_type=session["scam_type"],
-    )
+    ))
+    try:
+        safety_batches = await asyncio.to_thread(
+            _safety_extract_many, [message_text, *hist_scammer_texts]
+        )
+    except BaseException:
+        llm_task.cancel()
+        raise
+    llm_result = await llm_task
     reply = llm_result["reply"]
     llm_scam_type = llm_result["scamType"]
     llm_confidence = llm_result["confidence"]
@@ -958,23 +1358,19 @@ async def _honeypot_core(req: HoneypotRequest, x_api_key: str = None):
                 if v_str:
                     new_intel.append({"type": intel_type, "value": v_str, "confidence": 0.85})
 
-    new_intel = _dedup_intel(new_intel, session_id)
-    session["intelligence"].extend(new_intel)
+    new_intel = _dedup_intel(new_intel, session["seen_intel"])
+    _record_intel(session, new_intel)
 
     # 2b. Safety-net: catch any structured data the LLM might have missed
-    safety_items = _safety_extract(message_text)
-    safety_items = _dedup_intel(safety_items, session_id)
-    session["intelligence"].extend(safety_items)
+    safety_items = _dedup_intel(safety_batches[0], session["seen_intel"])
+    _record_intel(session, safety_items)
 
     # 2c. CRITICAL for serverless: Re-extract from ALL conversation history
     # On Vercel/serverless, session state is lost between turns. Re-extract from
     # the full conversationHistory to recover intelligence from previous turns.
-    if history:
-        for hist_msg in history:
-            if hist_msg.get("sender") in ("scammer",):
-                hist_safety = _safety_extract(hist_msg.get("text", ""))
-                hist_safety = _dedup_intel(hist_safety, session_id)
-                session["intelligence"].extend(hist_safety)
+    for hist_safety in safety_batches[1:]:
+        hist_safety = _dedup_intel(hist_safety, session["seen_intel"])
+        _record_intel(session, hist_safety)
 
     # 3. Update session with LLM classification
     session["scam_confidence"] = max(session["scam_confidence"], llm_confidence)
@@ -984,19 +1380,16 @@ async def _honeypot_core(req: HoneypotRequest, x_api_key: str = None):
         session["scam_type"] = llm_scam_type
 
     session["history"].append({"sender": "scammer", "text": message_text})
+    session["scammer_texts_lower"].append(message_text.lower())
     session["history"].append({"sender": "agent", "text": reply})
     session["turn_count"] += 1
 
     # 4. Categorize ALL session intelligence into evaluation-compatible format
     all_intel = session["intelligence"]
-    bank_accounts = list({i["value"] for i in all_intel if i["type"] in ("bank_account", "ifsc")})
-    upi_ids = list({i["value"] for i in all_intel if i["type"] == "upi"})
-    phishing_links = list({i["value"] for i in all_intel if i["type"] == "url"})
-    phone_numbers = list({i["value"] for i in all_intel if i["type"] == "phone"})
-    email_addresses = list({i["value"] for i in all_intel if i["type"] == "email"})
-    case_ids = list({i["value"] for i in all_intel if i["type"] in ("case_id", "reference_id")})
-    policy_numbers = list({i["value"] for i in all_intel if i["type"] == "policy_number"})
-    order_numbers = list({i["value"] for i in all_intel if i["type"] == "order_number"})
+    # Buckets are kept up to date as items arrive — no rescan of the whole session
+    extracted_intel = _bucket_lists(session["intel_buckets"])
+    (phone_numbers, bank_accounts, upi_ids, phishing_links,
+     email_addresses, case_ids, policy_numbers, order_numbers) = extracted_intel.values()
 
     # 5. Calculate engagement metrics (CRITICAL for scoring — 20 points)
     total_messages = len(session["history"])
@@ -1011,31 +1404,13 @@ async def _honeypot_core(req: HoneypotRequest, x_api_key: str = None):
     engagement_duration = max(wall_clock_duration, estimated_duration)
 
     # 6. Dynamic red flag analysis on ALL conversation text
-    all_scammer_text = " ".join(
-        m.get("text", "") for m in session["history"] if m.get("sender") == "scammer"
-    ).lower()
+    all_scammer_text = " ".join(session["scammer_texts_lower"])
     if req.conversationHistory:
-        all_scammer_text += " " + " ".join(
-            m.get("text", "") for m in req.conversationHistory if m.get("sender") == "scammer"
-        ).lower()
+        # history is req.conversationHistory here — reuse the texts split out in step 2c
+        all_scammer_text += " " + " ".join(hist_scammer_texts).lower()
     all_scammer_text += " " + message_text.lower()
 
-    red_flags = []
-    _RF_PATTERNS = [
-        ("Urgency/time pressure tactics", r"(?:urgent|immediately|right\s*now|hurry|quick|fast|within\s*\d|last\s*chance|expire|deadline|limited\s*time|act\s*now|don.t\s*delay)"),
-        ("OTP/credential request", r"(?:otp|one\s*time\s*password|verification\s*code|cvv|pin\s*number|password|credential|secret\s*code)"),
-        ("Account block/freeze threat", r"(?:block|freeze|suspend|disconnect|deactivat|cancel|terminat|restrict|disable|locked|hold\s*your\s*account)"),
-        ("Legal/arrest threat", r"(?:legal\s*action|arrest|police|court|warrant|cbi|summon|prosecut|jail|penalty|fine\s*of|imprisonment)"),
-        ("Too-good-to-be-true offer", r"(?:congratulat|won|winner|prize|reward|cashback|guaranteed\s*return|100\s*%|free\s*gift|selected|lucky|jackpot|bonus)"),
-        ("Suspicious link/download", r"(?:click.*(?:link|here|below)|download|install|visit\s*(?:this|our)|verify.*(?:link|url)|\.fake|amaz0n|http)"),
-        ("Request for sensitive data", r"(?:share.*(?:account|aadhaar|pan|otp|bank)|send.*(?:money|amount|payment)|provide.*(?:detail|number|info))"),
-        ("Unsolicited contact", r"(?:calling\s*from|this\s*is\s*(?:from|the)|we\s*(?:are|have)\s*(?:from|noticed)|your\s*(?:account|application|policy|order)\s*(?:has|is|was))"),
-        ("Upfront fee/payment demand", r"(?:processing\s*fee|registration\s*fee|advance\s*payment|pay.*(?:first|now|immediate)|transfer.*(?:amount|fee)|service\s*charge|tax\s*payment)"),
-        ("Impersonation of authority", r"(?:(?:from|calling)\s*(?:sbi|rbi|police|income\s*tax|customs|microsoft|amazon|paytm|government|ministry)|official|authorized|certified|department|division|officer)"),
-    ]
-    for label, pattern in _RF_PATTERNS:
-        if re.search(pattern, all_scammer_text, re.I):
-            red_flags.append(label)
+    red_flags = _detect_red_flags(all_scammer_text)
 
     # 7. Build evaluation-compatible response with all scoring fields
     has_intel = bool(phone_numbers or bank_accounts or upi_ids or phishing_links or email_addresses or case_ids or policy_numbers or order_numbers)
@@ -1067,42 +1442,146 @@ async def _honeypot_core(req: HoneypotRequest, x_api_key: str = None):
         f"and deceptive communication to manipulate the target."
     )
 
-    return {
-        "status": "success",
-        "sessionId": session_id,
-        "reply": reply,
-        "scamDetected": is_scam,
-        "scamType": final_scam_type,
-        "confidenceLevel": final_confidence,
-        "totalMessagesExchanged": total_messages,
-        "engagementDurationSeconds": round(engagement_duration, 2),
-        "extractedIntelligence": {
-            "phoneNumbers": phone_numbers,
-            "bankAccounts": bank_accounts,
-            "upiIds": upi_ids,
-            "phishingLinks": phishing_links,
-            "emailAddresses": email_addresses,
-            "caseIds": case_ids,
-            "policyNumbers": policy_numbers,
-            "orderNumbers": order_numbers,
-        },
-        "engagementMetrics": {
-            "engagementDurationSeconds": round(engagement_duration, 2),
-            "totalMessagesExchanged": total_messages,
-        },
-        "agentNotes": agent_notes,
-        "analysis": {
-            "is_scam": is_scam,
-            "scam_confidence": final_confidence,
-            "scam_type": final_scam_type,
-            "urgency_level": llm_urgency,
-        },
-        "intelligence": {
-            "extracted": new_intel,
-            "all_items": all_intel,
-            "total_items": len(all_intel),
-        },
+    response = _build_honeypot_response(
+        session_id=session_id,
+        reply=reply,
+        scam_detected=is_scam,
+        scam_type=final_scam_type,
+        confidence=final_confidence,
+        total_messages=total_messages,
+        duration_seconds=engagement_duration,
+        extracted_intel=extracted_intel,
+        agent_notes=agent_notes,
+        urgency=llm_urgency,
+    )
+    response["intelligence"] = {
+        "extracted": new_intel,
+        "all_items": all_intel,
+        "total_items": len(all_intel),
     }
+    return response
+
+
+_STT_MODEL = "whisper-large-v3"
+_STT_MAX_CONCURRENT = 5  # parallel Whisper requests per batch (Groq rate limits apply)
+
+
+async def _transcribe_batch(clips: list[tuple[str, Any]], max_concurrent: int = _STT_MAX_CONCURRENT) -> list[str]:
+    """Transcribe (filename, audio) clips concurrently with Groq Whisper.
+
+    Returns one transcript per clip, in input order; a failed clip yields "".
+    """
+    try:
+        clients = _get_groq_clients()
+    except Exception as e:
+        logger.error("[STT ERROR] %s", e)
+        clients = []
+    if not clients:
+        return [""] * len(clips)
+    client = clients[0]
+    sem = asyncio.Semaphore(max_concurrent)
+
+    async def _one(clip: tuple[str, Any]) -> str:
+        async with sem:
+            try:
+                result = await client.audio.transcriptions.create(
+                    file=clip,
+                    model=_STT_MODEL,
+                    temperature=0,
+                    # Only .text is read — plain json skips building per-segment objects
+                    response_format="json",
+                )
+                return result.text or ""
+            except Exception as e:
+                logger.error("[STT ERROR] %s", e)
+                return ""
+
+    return list(await asyncio.gather(*(_one(clip) for clip in clips)))
+
+
+_STT_CHUNK_MIN_SECONDS = 120  # shorter clips go to Whisper whole
+_STT_CHUNK_SECONDS = 45
+
+
+def _split_long_wav(file_obj, chunk_seconds: int = _STT_CHUNK_SECONDS) -> Optional[list[bytes]]:
+    """Split a long PCM WAV upload into in-memory WAV chunks of chunk_seconds.
+
+    Returns None for non-WAV input or clips short enough to send whole.
+    The file position is always rewound so the caller can still upload it as-is.
+    """
+    try:
+        with wave.open(file_obj, "rb") as src:
+            params = src.getparams()
+            if params.nframes <= params.framerate * _STT_CHUNK_MIN_SECONDS:
+                return None
+            frames_per_chunk = params.framerate * chunk_seconds
+            chunks = []
+            while True:
+                frames = src.readframes(frames_per_chunk)
+                if not frames:
+                    break
+                buf = io.BytesIO()
+                with wave.open(buf, "wb") as dst:
+                    dst.setparams(params)  # frame count is corrected on close
+                    dst.writeframes(frames)
+                chunks.append(buf.getvalue())
+            return chunks
+    except (wave.Error, EOFError):
+        return None  # not a PCM WAV (mp3/webm/ogg...) — Whisper takes it whole
+    finally:
+        file_obj.seek(0)
+
+
+# Speech indicators: (name, weight, compiled pattern). AI/script cues raise the score,
+# human fillers lower it. Each pattern is compiled once and counted on its own, so
+# matches of different indicators may overlap (as they did with per-request findall).
+_SPEECH_INDICATORS = tuple(
+    (name, weight, re.compile(pattern, re.I))
+    for name, weight, pattern in (
+        ("formal_language", 0.15, r"\b(?:hereby|furthermore|additionally|consequently)\b"),
+        ("scripted", 0.25, r"\b(?:this is a (?:recorded|automated) message)\b"),
+        ("ivr_script", 0.25, r"\b(?:press \d|press one|your call is important)\b"),
+        ("scam_script", 0.20, r"\b(?:verify your (?:identity|account|details))\b"),
+        ("threat_script", 0.20, r"\b(?:legal action will be taken|warrant.*issued)\b"),
+        ("fillers", -0.20, r"\b(?:um+|uh+|hmm+|er+|ah+|like,|you know,)\b"),
+    )
+)
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+
+@lru_cache(maxsize=256)
+def _analyze_transcription(transcription: str) -> tuple[float, tuple[str, ...]]:
+    """Score a transcript for AI-generated speech. Returns (score in [0, 1], indicators).
+
+    Pure function of the text, so results are cached (retries/re-uploads of the same clip).
+    """
+    score = 0.3
+    if not transcription.strip():
+        return score, ()  # nothing to analyze (no key / STT failed / silent clip)
+    indicators = []
+
+    text_lower = transcription.lower()
+    for name, weight, pattern in _SPEECH_INDICATORS:
+        count = sum(1 for _ in pattern.finditer(text_lower))
+        if count:
+            score += weight
+            indicators.append(f"{name}: {count}")
+
+    # Strip each sentence once; the length filter applies to the stripped raw text
+    # and only sentences that pass it are tokenized.
+    lengths = []
+    for sentence in _SENTENCE_SPLIT_RE.split(transcription):
+        sentence = sentence.strip()
+        if len(sentence) > 5:
+            lengths.append(len(sentence.split()))
+    if len(lengths) >= 3:
+        mean = sum(lengths) / len(lengths)
+        variance = sum((l - mean) ** 2 for l in lengths) / len(lengths)
+        if variance < 4:
+            score += 0.10
+            indicators.append(f"uniform_sentences: var={variance:.1f}")
+
+    return max(0.0, min(1.0, score)), tuple(indicators)
 
 
 @app.post("/api/voice/detect")
@@ -1114,65 +1593,34 @@ async def voice_detect_endpoint(
     if x_api_key and x_api_key != API_KEY:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
-    audio_bytes = await audio.read()
-    if not audio_bytes:
+    # Hand the spooled upload file straight to the SDK instead of copying it into a
+    # bytes object first — avoids holding the clip in memory twice.
+    audio_file = audio.file
+    audio_file.seek(0, 2)
+    if audio_file.tell() == 0:
         raise HTTPException(status_code=400, detail="Empty audio file")
+    audio_file.seek(0)
 
     transcription = ""
     if GROQ_API_KEY:
-        try:
-            clients = _get_groq_clients()
-            client = clients[0] if clients else None
-            if client:
-                result = await asyncio.to_thread(
-                    client.audio.transcriptions.create,
-                    file=(audio.filename or "audio.wav", audio_bytes),
-                    model="whisper-large-v3",
-                    temperature=0,
-                    response_format="verbose_json",
-                )
-                transcription = result.text or ""
-        except Exception as e:
-            print(f"[STT ERROR] {e}")
+        # Long WAV recordings are split into windows and transcribed concurrently
+        chunks = await asyncio.to_thread(_split_long_wav, audio_file)
+        if chunks:
+            clips = [(f"chunk{i}.wav", chunk) for i, chunk in enumerate(chunks)]
+        else:
+            clips = [(audio.filename or "audio.wav", audio_file)]
+        texts = await _transcribe_batch(clips)
+        transcription = " ".join(t.strip() for t in texts if t.strip())
 
     # Heuristic AI speech analysis
-    score = 0.3
-    indicators = []
-    text_lower = transcription.lower()
-
-    ai_patterns = [
-        (r"\b(hereby|furthermore|additionally|consequently)\b", 0.15, "formal_language"),
-        (r"\b(this is a (recorded|automated) message)\b", 0.25, "scripted"),
-        (r"\b(press \d|press one|your call is important)\b", 0.25, "ivr_script"),
-        (r"\b(verify your (identity|account|details))\b", 0.20, "scam_script"),
-        (r"\b(legal action will be taken|warrant.*issued)\b", 0.20, "threat_script"),
-    ]
-    human_patterns = [
-        (r"\b(um+|uh+|hmm+|er+|ah+|like,|you know,)\b", -0.20, "fillers"),
-    ]
-
-    for pattern, weight, name in ai_patterns + human_patterns:
-        matches = re.findall(pattern, text_lower, re.I)
-        if matches:
-            score += weight
-            indicators.append(f"{name}: {len(matches)}")
-
-    sentences = [s.strip() for s in re.split(r"[.!?]+", transcription) if len(s.strip()) > 5]
-    if len(sentences) >= 3:
-        lengths = [len(s.split()) for s in sentences]
-        variance = sum((l - sum(lengths)/len(lengths))**2 for l in lengths) / len(lengths)
-        if variance < 4:
-            score += 0.10
-            indicators.append(f"uniform_sentences: var={variance:.1f}")
-
-    score = max(0.0, min(1.0, score))
+    score, indicators = _analyze_transcription(transcription)
 
     return {
         "status": "success",
         "isAIGenerated": score >= 0.55,
         "confidence": round(score, 4),
         "transcription": transcription,
-        "analysis": {"indicators": indicators},
+        "analysis": {"indicators": list(indicators)},
     }
 
 # ═══════════════════════════════════════════════
@@ -1185,9 +1633,91 @@ ELEVENLABS_VOICES = {
     "Male": "ErXwobaYiN019PkySvjV",    # Antoni (free, pre-installed)
 }
 
+_tts_http = None  # shared httpx.AsyncClient for ElevenLabs (lazy, closed in lifespan)
+
+
+def _get_tts_http():
+    """Return the pooled ElevenLabs HTTP client — keep-alive connections are reused across utterances."""
+    global _tts_http
+    if _tts_http is None:
+        import httpx
+        try:
+            import h2  # noqa: F401 — HTTP/2 is used only when the h2 extra is installed
+            http2 = True
+        except ImportError:
+            http2 = False
+        _tts_http = httpx.AsyncClient(
+            base_url=ELEVENLABS_API_URL,
+            http2=http2,
+            timeout=httpx.Timeout(15.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=120.0),
+            headers={"Accept": "audio/mpeg", "xi-api-key": ELEVENLABS_API_KEY},
+        )
+    return _tts_http
+
+
+_TTS_MODEL_ID = "eleven_turbo_v2_5"
+_TTS_VOICE_SETTINGS = {"stability": 0.5, "similarity_boost": 0.75}
+# ElevenLabs output_format → response media type. ulaw_8000 is what telephony media
+# streams expect, so callers bridging to a phone line get it without a transcode step.
+_TTS_DEFAULT_FORMAT = "mp3_44100_128"
+_TTS_OUTPUT_FORMATS = {
+    "mp3_44100_128": "audio/mpeg",
+    "mp3_22050_32": "audio/mpeg",
+    "ulaw_8000": "audio/basic",
+    "pcm_16000": "audio/L16;rate=16000",
+}
+
+# LRU of synthesized audio — the persona repeats stock lines (greetings, fallback
+# replies), and a hit skips the ElevenLabs round trip entirely. ~20-60KB per clip.
+_TTS_CACHE: "OrderedDict[str, bytes]" = OrderedDict()
+_TTS_CACHE_MAX = 128
+
+
+def _tts_cache_key(voice_id: str, text: str, output_format: str = _TTS_DEFAULT_FORMAT) -> str:
+    settings = f"{_TTS_VOICE_SETTINGS['stability']}/{_TTS_VOICE_SETTINGS['similarity_boost']}"
+    key = f"{voice_id}|{_TTS_MODEL_ID}|{settings}|{output_format}|{text}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+async def _first_tts_chunk(stream) -> Optional[bytes]:
+    """First non-empty audio chunk from an upstream byte iterator, or None if there is none."""
+    try:
+        async for chunk in stream:
+            if chunk:
+                return chunk
+    except Exception as e:
+        logger.error("[TTS STREAM ERROR] %s", e)
+    return None
+
+
+async def _relay_tts_stream(upstream, stream, first: bytes, cache_key: str):
+    """Yield ElevenLabs audio chunks as they arrive; cache the clip once it completes.
+
+    ``first`` was already read from ``stream`` before the response was committed.
+    """
+    chunks = [first]
+    try:
+        yield first
+        async for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
+    except Exception as e:
+        logger.error("[TTS STREAM ERROR] %s", e)
+        return  # partial audio — never cache it
+    finally:
+        await upstream.aclose()
+    audio = b"".join(chunks)
+    if audio:
+        _TTS_CACHE[cache_key] = audio
+        if len(_TTS_CACHE) > _TTS_CACHE_MAX:
+            _TTS_CACHE.popitem(last=False)
+
+
 class TTSRequest(BaseModel):
     text: str
     gender: str = "Male"
+    output_format: str = _TTS_DEFAULT_FORMAT  # "ulaw_8000" for telephony bridges
 
 @app.post("/api/tts")
 async def tts_endpoint(req: TTSRequest):
@@ -1196,53 +1726,71 @@ async def tts_endpoint(req: TTSRequest):
         return Response(content=b"", status_code=204,
                         headers={"X-TTS-Status": "no-api-key"})
 
+    media_type = _TTS_OUTPUT_FORMATS.get(req.output_format)
+    if media_type is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported output_format: {req.output_format}")
+
     # Use free voice directly — no fallback chain needed, no wasted API calls
     voice_id = ELEVENLABS_VOICES.get(req.gender, ELEVENLABS_VOICES["Male"])
 
-    tts_payload = json.dumps({
-        "text": req.text,
-        "model_id": "eleven_turbo_v2_5",
-        "voice_settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.75,
-        },
-    }).encode("utf-8")
-
-    headers_dict = {
-        "Accept": "audio/mpeg",
-        "Content-Type": "application/json",
-        "xi-api-key": ELEVENLABS_API_KEY,
-    }
+    cache_key = _tts_cache_key(voice_id, req.text, req.output_format)
+    audio = _TTS_CACHE.get(cache_key)
+    if audio is not None:
+        _TTS_CACHE.move_to_end(cache_key)
+        return Response(
+            content=audio,
+            media_type=media_type,
+            headers={"X-TTS-Status": "ok", "X-Voice-Gender": req.gender, "X-TTS-Cache": "hit"},
+        )
 
-    url = f"{ELEVENLABS_API_URL}/text-to-speech/{voice_id}"
+    tts_payload = _json_dumps_bytes({
+        "text": req.text,
+        "model_id": _TTS_MODEL_ID,
+        "voice_settings": _TTS_VOICE_SETTINGS,
+    })
+
+    # Streaming endpoint: audio is relayed chunk by chunk as ElevenLabs synthesizes it,
+    # so the client starts receiving bytes at first-chunk time, not full-synthesis time.
+    # The response is committed only once the first audio chunk is in hand, so an
+    # upstream error or an empty body still falls back with a 204.
+    client = _get_tts_http()
     try:
-        http_req = urllib.request.Request(url, data=tts_payload, headers=headers_dict, method="POST")
-        status_code, audio_bytes = await asyncio.to_thread(_fetch_tts, http_req)
-        if audio_bytes:
-            return Response(
-                content=audio_bytes,
-                media_type="audio/mpeg",
-                headers={"X-TTS-Status": "ok", "X-Voice-Gender": req.gender},
-            )
+        upstream = await client.send(
+            client.build_request(
+                "POST",
+                f"/text-to-speech/{voice_id}/stream",
+                params={"output_format": req.output_format},
+                content=tts_payload,
+                headers={"Content-Type": "application/json", "Accept": media_type},
+            ),
+            stream=True,
+        )
     except Exception as e:
-        print(f"[TTS ERROR] {e}")
+        logger.error("[TTS ERROR] %s", e)
+        upstream = None
+
+    if upstream is not None:
+        if upstream.status_code == 200:
+            stream = upstream.aiter_bytes()
+            first = await _first_tts_chunk(stream)
+            if first is not None:
+                return StreamingResponse(
+                    _relay_tts_stream(upstream, stream, first, cache_key),
+                    media_type=media_type,
+                    headers={"X-TTS-Status": "ok", "X-Voice-Gender": req.gender},
+                )
+            logger.error("[TTS ERROR] upstream returned no audio")
+            await upstream.aclose()
+        else:
+            try:
+                body = (await upstream.aread()).decode("utf-8", errors="replace")[:200]
+                logger.error("[TTS HTTP ERROR] %s: %s", upstream.status_code, body)
+            finally:
+                await upstream.aclose()
 
     return Response(content=b"", status_code=204,
                     headers={"X-TTS-Status": "fallback-exhausted"})
 
-def _fetch_tts(req: urllib.request.Request) -> tuple[int, bytes]:
-    """Synchronous helper for ElevenLabs API call. Returns (status_code, audio_bytes)."""
-    try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return (200, resp.read())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")[:200]
-        print(f"[TTS HTTP ERROR] {e.code}: {body}")
-        return (e.code, b"")
-    except Exception as e:
-        print(f"[TTS FETCH ERROR] {e}")
-        return (0, b"")
-
 
 # Handle POST at root for backward compatibility with evaluators
 @app.post("/")
@@ -1282,12 +1830,11 @@ async def end_session(req: EndSessionRequest):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[END SESSION ERROR] {e}")
+        logger.error("[END SESSION ERROR] %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to save session: {str(e)}")
 
     # Clean up memory
     sessions.pop(session_id, None)
-    _seen_intel.pop(session_id, None)
 
     return {
         "status": "success",
@@ -1308,13 +1855,40 @@ async def end_session(req: EndSessionRequest):
 # ═══════════════════════════════════════════════
 
 @app.get("/admin")
-async def admin_page():
+async def admin_page(if_none_match: Optional[str] = Header(None)):
     """Serve the admin dashboard HTML."""
-    base = Path(__file__).resolve().parent.parent
-    html_path = base / "frontend" / "admin.html"
-    if html_path.exists():
-        return FileResponse(html_path, media_type="text/html")
-    return HTMLResponse("<h1>Admin page not found</h1><p>Place admin.html in frontend/</p>")
+    if _ADMIN_PAGE:
+        return _page_response(_ADMIN_PAGE, if_none_match)
+    return HTMLResponse(_ADMIN_FALLBACK_HTML)
+
+
+# All dashboard aggregates in a single round trip (was seven sequential queries)
+_ADMIN_STATS_SQL = """
+    WITH s AS (
+        SELECT COUNT(*) AS total,
+               COUNT(*) FILTER (WHERE scam_confidence >= 0.3) AS scam_detected,
+               COALESCE(AVG(scam_confidence), 0) AS avg_conf,
+               COUNT(*) FILTER (WHERE started_at >= NOW() - INTERVAL '7 days') AS recent_count
+        FROM sessions
+    )
+    SELECT s.*,
+           (SELECT COUNT(*) FROM messages) AS total_msgs,
+           (SELECT COUNT(*) FROM intelligence) AS total_intel,
+           (SELECT COALESCE(json_object_agg(scam_type, cnt ORDER BY cnt DESC), '{}')
+              FROM (SELECT scam_type, COUNT(*) AS cnt FROM sessions GROUP BY scam_type) t
+           ) AS scam_types
+    FROM s
+"""
+
+
+# Short-lived cache of the aggregate row: dashboard polls within the TTL skip the DB.
+# Invalidated whenever a session is saved or deleted, so writes show up immediately.
+_ADMIN_STATS_TTL = 10.0
+_admin_stats_cache: dict[str, Any] = {"row": None, "at": 0.0}
+
+
+def _invalidate_admin_stats() -> None:
+    _admin_stats_cache["row"] = None
 
 
 @app.get("/api/admin/stats")
@@ -1324,23 +1898,21 @@ async def admin_stats():
     if not pool:
         return {"error": "Database not available", "total_sessions": 0}
 
-    async with pool.acquire() as conn:
-        total = await conn.fetchval("SELECT COUNT(*) FROM sessions")
-        scam_detected = await conn.fetchval("SELECT COUNT(*) FROM sessions WHERE scam_confidence >= 0.3")
-        avg_conf = await conn.fetchval("SELECT COALESCE(AVG(scam_confidence), 0) FROM sessions")
-        total_msgs = await conn.fetchval("SELECT COUNT(*) FROM messages")
-        total_intel = await conn.fetchval("SELECT COUNT(*) FROM intelligence")
-
-        # Scam type breakdown
-        type_rows = await conn.fetch(
-            "SELECT scam_type, COUNT(*) as cnt FROM sessions GROUP BY scam_type ORDER BY cnt DESC"
-        )
-        scam_types = {r["scam_type"]: r["cnt"] for r in type_rows}
-
-        # Recent 7 days session count
-        recent_count = await conn.fetchval(
-            "SELECT COUNT(*) FROM sessions WHERE started_at >= NOW() - INTERVAL '7 days'"
-        )
+    now = time.monotonic()
+    row = _admin_stats_cache["row"]
+    if row is None or now - _admin_stats_cache["at"] > _ADMIN_STATS_TTL:
+        row = await pool.fetchrow(_ADMIN_STATS_SQL)
+        _admin_stats_cache.update(row=row, at=now)
+    total = row["total"]
+    scam_detected = row["scam_detected"]
+    avg_conf = row["avg_conf"]
+    total_msgs = row["total_msgs"]
+    total_intel = row["total_intel"]
+    recent_count = row["recent_count"]
+    # json aggregate arrives as text; key order follows the ORDER BY cnt DESC
+    scam_types = row["scam_types"]
+    if isinstance(scam_types, str):
+        scam_types = _json_loads(scam_types)
 
     return {
         "total_sessions": total,
@@ -1366,31 +1938,38 @@ async def admin_list_sessions(
         return {"error": "Database not available", "sessions": []}
 
     offset = (page - 1) * limit
-    async with pool.acquire() as conn:
-        # Count total
-        if scam_type:
-            total = await conn.fetchval(
-                "SELECT COUNT(*) FROM sessions WHERE scam_type = $1", scam_type
-            )
-            rows = await conn.fetch(
+    # Count total and fetch the page concurrently, each on its own pooled connection
+    if scam_type:
+        total, rows = await asyncio.gather(
+            pool.fetchval("SELECT COUNT(*) FROM sessions WHERE scam_type = $1", scam_type),
+            pool.fetch(
                 """SELECT id, persona, scam_type, scam_confidence, turn_count, status,
                           started_at, ended_at
                    FROM sessions WHERE scam_type = $1
                    ORDER BY started_at DESC LIMIT $2 OFFSET $3""",
                 scam_type, limit, offset,
-            )
-        else:
-            total = await conn.fetchval("SELECT COUNT(*) FROM sessions")
-            rows = await conn.fetch(
+            ),
+        )
+    else:
+        total, rows = await asyncio.gather(
+            pool.fetchval("SELECT COUNT(*) FROM sessions"),
+            pool.fetch(
                 """SELECT id, persona, scam_type, scam_confidence, turn_count, status,
                           started_at, ended_at
                    FROM sessions ORDER BY started_at DESC LIMIT $1 OFFSET $2""",
                 limit, offset,
-            )
+            ),
+        )
 
     session_list = []
+    # Most sessions share the same persona JSON — decode each distinct payload once per page
+    decoded_personas: dict[str, Any] = {}
     for r in rows:
-        persona_data = json.loads(r["persona"]) if isinstance(r["persona"], str) else r["persona"]
+        persona_data = r["persona"]
+        if isinstance(persona_data, str):
+            if persona_data not in decoded_personas:
+                decoded_personas[persona_data] = _json_loads(persona_data)
+            persona_data = decoded_personas[persona_data]
         session_list.append({
             "id": r["id"],
             "persona": persona_data,
@@ -1418,24 +1997,23 @@ async def admin_get_session(session_id: str):
     if not pool:
         raise HTTPException(status_code=503, detail="Database not available")
 
-    async with pool.acquire() as conn:
-        session_row = await conn.fetchrow(
-            "SELECT * FROM sessions WHERE id = $1", session_id
-        )
-        if not session_row:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        messages = await conn.fetch(
+    # Independent reads — run them concurrently, each on its own pooled connection
+    session_row, messages, intel_items = await asyncio.gather(
+        pool.fetchrow("SELECT * FROM sessions WHERE id = $1", session_id),
+        pool.fetch(
             "SELECT sender, text, timestamp, seq FROM messages WHERE session_id = $1 ORDER BY seq",
             session_id,
-        )
-        intel_items = await conn.fetch(
+        ),
+        pool.fetch(
             "SELECT type, value, confidence, extracted_at FROM intelligence WHERE session_id = $1",
             session_id,
-        )
+        ),
+    )
+    if not session_row:
+        raise HTTPException(status_code=404, detail="Session not found")
 
     persona_data = (
-        json.loads(session_row["persona"])
+        _json_loads(session_row["persona"])
         if isinstance(session_row["persona"], str)
         else session_row["persona"]
     )
@@ -1486,6 +2064,7 @@ async def admin_delete_session(session_id: str):
         deleted_count = 0
     if deleted_count == 0:
         raise HTTPException(status_code=404, detail="Session not found")
+    _invalidate_admin_stats()
 
     return {"status": "success", "message": f"Session {session_id} deleted"}
 
@@ -1513,7 +2092,7 @@ async def admin_get_settings():
 
     result = {}
     for r in rows:
-        val = json.loads(r["value"]) if isinstance(r["value"], str) else r["value"]
+        val = _json_loads(r["value"]) if isinstance(r["value"], str) else r["value"]
         result[r["key"]] = val
 
     return {"settings": result}
@@ -1531,7 +2110,7 @@ async def admin_update_settings(req: SettingsUpdate):
     if not pool:
         raise HTTPException(status_code=503, detail="Database not available")
 
-    serialized = json.dumps(req.value)
+    serialized = _json_dumps(req.value)
     async with pool.acquire() as conn:
         await conn.execute("""
             INSERT INTO settings (key, value, updated_at)
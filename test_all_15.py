@@ -2,430 +2,460 @@
 Comprehensive 15-Scenario Honeypot Evaluation Test
 Simulates the EXACT evaluator scoring with all 15 competition scam types.
 Each scenario: 10 turns, realistic scammer follow-ups with fakeData embedded.
+
+Usage:
+    python test_all_15.py                  # all scenarios, one at a time, per-turn output
+    python test_all_15.py --quiet          # all scenarios on MAX_PARALLEL_SCENARIOS workers
+    python test_all_15.py --workers 4      # explicit worker count (per-turn output interleaves)
+    python test_all_15.py --async          # overlap every scenario on one event loop
+    python test_all_15.py --sample 5       # weighted random draw of 5 scenarios
+    python test_all_15.py bank_fraud       # one scenarioId, or every scenario of a scamType
+    python test_all_15.py --channel SMS    # every scenario sent over one channel
+    python test_all_15.py --intel upiId,phoneNumber   # scenarios planting all these fakeData fields
 """
 
+import argparse
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import uuid
 import json
 import time
 import re
+import random
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from array import array
+from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+try:
+    import orjson  # faster scenario decode; stdlib json is the fallback
+except ImportError:
+    orjson = None
+try:
+    import httpx  # HTTP/2 multiplexing when httpx[http2] is installed; requests otherwise
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
 
 # Configuration
 ENDPOINT_URL = "https://agentic-bot-tau.vercel.app/api/honeypot"
 API_KEY = "fae26946fc2015d9bd6f1ddbb447e2f7"
 
+# Scenarios are independent sessions, so they run on a thread pool; a semaphore caps
+# how many honeypot requests are in flight at once (replaces the fixed sleeps).
+MAX_PARALLEL_SCENARIOS = 8
+MAX_INFLIGHT_REQUESTS = 4
+_inflight = threading.Semaphore(MAX_INFLIGHT_REQUESTS)
+# Request pacing: a token bucket shared by all workers. Every turn costs the endpoint
+# one Groq completion, and the server turns Groq 429s into rule-based fallback replies
+# (HTTP 200), so the default stays inside the Groq free-tier budget (HONEYPOT_RPM, 30/min).
+# A 429 from the endpoint itself is handled only by _post_turn (honouring Retry-After).
+REQUESTS_PER_MINUTE = float(os.environ.get("HONEYPOT_RPM", "30"))
+REQUEST_BURST = 3
+MAX_429_WAITS = 3
+# 502/503/504 from the gateway in front of the endpoint: retried by _post_turn with
+# exponential backoff, whichever HTTP stack sent the turn
+GATEWAY_STATUSES = frozenset({502, 503, 504})
+MAX_GATEWAY_RETRIES = 2
+GATEWAY_BACKOFF = 0.3  # seconds, doubled per retry
+CONNECT_RETRIES = 2  # connection failures, retried by the transport
+# The evaluator resends the full history every turn (O(T^2) bytes per scenario), and
+# that stays the default so scores match it. Set HONEYPOT_HISTORY_WINDOW=N to send
+# only the last N history messages; the server also tracks each session by sessionId.
+# Opt-in fast path for regression sweeps: HONEYPOT_LEAK_SCAN_BELOW=50 runs the AI-leak
+# scan only for scenarios scoring under 50. Unset (default) scans every scenario.
+QUALITY_CHECK_MIN_SCORE = float(os.environ.get("HONEYPOT_LEAK_SCAN_BELOW", "0")) or None
+# Each scenario's full result is appended here as one JSON line when it finishes
+RESULTS_NDJSON_PATH = Path(__file__).with_name("test_results_15.ndjson")
+HISTORY_WINDOW = int(os.environ.get("HONEYPOT_HISTORY_WINDOW", "0")) or None
+
+# One keep-alive Session per worker thread (requests.Session is not thread-safe), so
+# each worker pays a single TCP+TLS handshake instead of one per turn.
+_thread_local = threading.local()
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks only when the bucket is empty."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """Take a token if one is available; otherwise return seconds until one is."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        while wait := self._take():
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        while wait := self._take():
+            await asyncio.sleep(wait)
+
+
+_bucket = TokenBucket(REQUESTS_PER_MINUTE / 60, REQUEST_BURST)
+
+
+def _retry_after_seconds(response, default=1.0):
+    try:
+        return min(30.0, max(0.0, float(response.headers.get('Retry-After', default))))
+    except (TypeError, ValueError):
+        return default  # HTTP-date form — not worth parsing for a test client
+
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before resending a turn, or None when `response` is final.
+
+    A 429 waits out Retry-After (up to MAX_429_WAITS times); gateway errors back off
+    exponentially on the first MAX_GATEWAY_RETRIES attempts.
+    """
+    if attempt >= MAX_429_WAITS:
+        return None
+    if response.status_code == 429:
+        return _retry_after_seconds(response)
+    if response.status_code in GATEWAY_STATUSES and attempt < MAX_GATEWAY_RETRIES:
+        return GATEWAY_BACKOFF * 2 ** attempt
+    return None
+
+
+_http2_client = None
+_http2_lock = threading.Lock()
+# Timeouts from whichever HTTP stack is in use
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout,) + ((httpx.TimeoutException,) if httpx else ())
+
+
+def _get_http_session():
+    """HTTP client for the calling worker.
+
+    With httpx[http2] installed, all workers share one thread-safe HTTP/2 client, so
+    concurrent turns are multiplexed over a single TLS connection with compressed
+    headers. Otherwise each thread gets its own keep-alive requests.Session.
+    """
+    global _http2_client
+    if httpx is not None:
+        if _http2_client is None:
+            with _http2_lock:
+                if _http2_client is None:
+                    _http2_client = httpx.Client(
+                        transport=httpx.HTTPTransport(http2=True, retries=CONNECT_RETRIES),
+                        timeout=30,
+                        headers={'Content-Type': 'application/json', 'x-api-key': API_KEY},
+                    )
+        return _http2_client
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({'Content-Type': 'application/json', 'x-api-key': API_KEY})
+        # Connection failures only: HTTP statuses are retried by _post_turn for both stacks
+        retry = Retry(total=CONNECT_RETRIES, backoff_factor=0.3, allowed_methods=frozenset({"POST"}))
+        session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry))
+        _thread_local.session = session
+    return session
+
 # ============================================================================
 # ALL 15 SCENARIOS
 # ============================================================================
 
-TEST_SCENARIOS = [
-    # 1. BANK FRAUD
-    {
-        "scenarioId": "bank_fraud",
-        "name": "Bank Fraud",
-        "scamType": "bank_fraud",
-        "initialMessage": "URGENT: Your SBI account has been compromised. Your account will be blocked in 2 hours. Share your account number and OTP immediately to verify your identity.",
-        "metadata": {"channel": "SMS", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "bankAccount": "1234567890123456",
-            "upiId": "scammer.fraud@fakebank",
-            "phoneNumber": "+91-9876543210"
-        },
-        "scammerFollowUps": [
-            "I am calling from SBI fraud department. My name is Rajesh Kumar. Your account ending 3456 has been flagged for suspicious activity.",
-            "Yes sir, I am authorized officer ID SBI-12345. Please verify your identity. What is your registered mobile number?",
-            "Sir, for verification I need to send you an OTP. My official number is +91-9876543210. You can call me back on this.",
-            "Sir, there is a refund of Rs. 15,000 pending. To process it, I need your bank account number 1234567890123456 for cross-verification.",
-            "Thank you sir. Now I need to verify the UPI linked to your account. The flagged UPI is scammer.fraud@fakebank. Can you confirm?",
-            "Sir the refund will be processed within 24 hours. Please share the OTP that you will receive now.",
-            "Sir please hurry, your account will be blocked soon. Can you check if you received the OTP?",
-            "Sir this is very urgent. The RBI has issued a directive. We need to complete verification before 5 PM today.",
-            "OK sir, one last thing. Please confirm your date of birth and full name as per bank records."
-        ]
-    },
-
-    # 2. UPI FRAUD
-    {
-        "scenarioId": "upi_fraud",
-        "name": "UPI Fraud",
-        "scamType": "upi_fraud",
-        "initialMessage": "Congratulations! You have won a cashback of Rs. 5000 from Paytm. To claim your reward, please verify your UPI details. This is from official customer support.",
-        "metadata": {"channel": "WhatsApp", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "upiId": "cashback.scam@fakeupi",
-            "phoneNumber": "+91-8765432109"
-        },
-        "scammerFollowUps": [
-            "This is from Paytm official rewards team. Your cashback ID is PTM-2026-789. You were selected in our Republic Day offer.",
-            "Sir, to verify your identity, can you share your Paytm registered mobile number? You can also reach us at +91-8765432109.",
-            "Thank you. Now to release the cashback, please make a small verification payment of Rs. 99 to our official UPI: cashback.scam@fakeupi",
-            "Sir this is a standard verification process. Once you pay Rs. 99, the Rs. 5000 cashback will be credited immediately.",
-            "Sir please hurry, this offer expires in 30 minutes. Many people are claiming this reward.",
-            "OK sir, you can also scan the QR code I will send. The UPI ID is cashback.scam@fakeupi.",
-            "Sir the payment gateway is showing your transaction is pending. Can you try again?",
-            "Sir do not worry, this is 100% safe. Paytm's terms and conditions apply.",
-            "Sir this is the last reminder. Offer closing at midnight."
-        ]
-    },
-
-    # 3. PHISHING
-    {
-        "scenarioId": "phishing",
-        "name": "Phishing Link",
-        "scamType": "phishing",
-        "initialMessage": "You have been selected for iPhone 15 Pro at just Rs. 999! Click here to claim: http://amaz0n-deals.fake-site.com/claim?id=12345. Offer expires in 10 minutes!",
-        "metadata": {"channel": "Email", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phishingLink": "http://amaz0n-deals.fake-site.com/claim?id=12345",
-            "emailAddress": "offers@fake-amazon-deals.com"
-        },
-        "scammerFollowUps": [
-            "Dear customer, this is a verified offer from Amazon India. You can contact us at offers@fake-amazon-deals.com for any queries.",
-            "Sir, only 5 units left! Click http://amaz0n-deals.fake-site.com/claim?id=12345 and fill in your delivery address.",
-            "This offer is part of Amazon's Great Indian Festival. You can verify at offers@fake-amazon-deals.com.",
-            "Sir, you just need to pay Rs. 999 processing fee. After payment, iPhone 15 Pro will be delivered in 3-5 days.",
-            "Sir, please fill the form at http://amaz0n-deals.fake-site.com/claim?id=12345 with name and payment details.",
-            "Sir many customers have already claimed. See the testimonials on our website.",
-            "Sir, if you face any issues with the link, email us at offers@fake-amazon-deals.com.",
-            "This is final notice. Your exclusive slot will be released in 2 minutes.",
-            "Sir the offer is genuine. We are a registered company. Your order will be confirmed once payment is done."
-        ]
-    },
-
-    # 4. KYC FRAUD
-    {
-        "scenarioId": "kyc_fraud",
-        "name": "KYC Fraud",
-        "scamType": "kyc_scam",
-        "initialMessage": "ALERT: Your SIM card will be deactivated within 24 hours due to incomplete KYC verification. Update your Aadhaar details immediately to avoid disconnection. Reply NOW.",
-        "metadata": {"channel": "SMS", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-7654321098",
-            "emailAddress": "kyc.verify@faketel.com"
-        },
-        "scammerFollowUps": [
-            "This is Jio KYC verification department. Your number has been flagged by TRAI for incomplete KYC. I am officer Priya Sharma.",
-            "Sir, to keep your number active, please share your Aadhaar number and date of birth for re-verification.",
-            "You can also call our helpline at +91-7654321098 for instant KYC update. This is our official verification number.",
-            "Sir, we need to verify your PAN card as well. Please share your PAN number for cross-verification with TRAI records.",
-            "Sir, you can also email your Aadhaar and PAN copies to kyc.verify@faketel.com for faster processing.",
-            "Sir, only 6 hours remaining. After that your number will be permanently blocked and you will lose your number.",
-            "Sir, please download our verification app from http://jio-kyc-verify.fakeapp.com and complete the process.",
-            "Sir, for security I will send you an OTP. Please share it to confirm your identity.",
-            "Sir, this is mandatory as per new TRAI guidelines. All numbers must be re-verified by this month end."
-        ]
-    },
-
-    # 5. JOB SCAM
-    {
-        "scenarioId": "job_scam",
-        "name": "Job Scam",
-        "scamType": "job_scam",
-        "initialMessage": "Dear Candidate, You have been shortlisted for a Data Entry position at Amazon India. Salary: Rs. 45,000/month. Work from home. Reply with your resume to confirm. Limited seats!",
-        "metadata": {"channel": "WhatsApp", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-6543210987",
-            "emailAddress": "hr.amazon.recruit@fakejobs.com"
-        },
-        "scammerFollowUps": [
-            "Welcome! I am Anil from Amazon HR department. Your application ID is AMZN-HR-2026-456. Congratulations on being shortlisted.",
-            "Sir, to proceed with onboarding, please share your full name, date of birth, and Aadhaar number for background verification.",
-            "Sir you can also send your documents to hr.amazon.recruit@fakejobs.com. Our HR team will verify within 2 hours.",
-            "Sir, there is a one-time registration fee of Rs. 2,500 for training materials and ID card. Please pay to proceed.",
-            "Sir, you can contact our HR head at +91-6543210987 for any doubts. He will explain everything.",
-            "Sir, payment can be made via UPI to amazon.hr.pay@fakebank or bank transfer. I will share account details.",
-            "Sir, many candidates have already completed registration. Only 3 seats remaining in your batch.",
-            "Sir, after payment you will receive your offer letter and joining date on email within 24 hours.",
-            "Sir, this is a genuine Amazon opportunity. We have placed 500+ candidates this year. Please complete payment today."
-        ]
-    },
-
-    # 6. LOTTERY SCAM
-    {
-        "scenarioId": "lottery_scam",
-        "name": "Lottery Scam",
-        "scamType": "lottery_scam",
-        "initialMessage": "CONGRATULATIONS!! You have won Rs. 25,00,000 in the KBC Lucky Draw 2026! Your ticket number KBC-99887766. Contact us immediately to claim your prize!",
-        "metadata": {"channel": "SMS", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-5432109876",
-            "bankAccount": "9876543210654321"
-        },
-        "scammerFollowUps": [
-            "Congratulations once again! I am Rohit from KBC Prize Department. Your winning amount of Rs. 25 lakhs is confirmed.",
-            "Sir, to release your prize money, we need your bank account details for direct transfer. Please share your account number.",
-            "Sir, our prize verification officer can be reached at +91-5432109876. You can confirm the prize with him.",
-            "Sir, there is a government tax of Rs. 12,500 that needs to be paid first. This is as per Income Tax rules for prize money.",
-            "Sir, please transfer the tax amount to our official account 9876543210654321. This is the RBI authorized account.",
-            "Sir, once we receive the tax payment, your Rs. 25 lakhs will be credited within 4 hours. This is guaranteed.",
-            "Sir, don't miss this opportunity. Many winners have already claimed their prizes this week.",
-            "Sir, if you have any doubts, you can call our verification number +91-5432109876. We are available 24/7.",
-            "Sir, the prize claim deadline is tomorrow. After that your prize will be forfeited and given to the next winner."
-        ]
-    },
-
-    # 7. ELECTRICITY BILL SCAM
-    {
-        "scenarioId": "electricity_bill",
-        "name": "Electricity Bill Scam",
-        "scamType": "electricity_scam",
-        "initialMessage": "FINAL NOTICE: Your electricity will be disconnected TODAY at 8 PM due to pending bill of Rs. 8,450. Pay immediately to avoid disconnection. Contact helpline NOW.",
-        "metadata": {"channel": "SMS", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-4321098765",
-            "upiId": "ebill.payment@scamupi"
-        },
-        "scammerFollowUps": [
-            "This is from TANGEDCO/State Electricity Board. Your consumer number has 3 months pending bill. Disconnection order has been issued.",
-            "Sir, to avoid disconnection, pay Rs. 8,450 immediately. Our lineman is already on the way to your area.",
-            "Sir, you can reach our billing department at +91-4321098765. They will confirm your pending amount.",
-            "Sir, for instant payment, use UPI to ebill.payment@scamupi. This is the official electricity board payment ID.",
-            "Sir, your meter reading shows excessive usage. There might be additional penalty if not paid today.",
-            "Sir, once payment is confirmed, I will cancel the disconnection order. Please share payment screenshot.",
-            "Sir, if UPI is not working, you can also do NEFT to our account. I will share the details.",
-            "Sir, this is the last warning. After 8 PM, reconnection will cost Rs. 5,000 extra plus the pending bill.",
-            "Sir, many people in your area have already paid. Don't wait until the last moment."
-        ]
-    },
-
-    # 8. GOVT SCHEME FRAUD
-    {
-        "scenarioId": "govt_scheme",
-        "name": "Government Scheme Fraud",
-        "scamType": "govt_scheme",
-        "initialMessage": "PM Kisan Samman Nidhi: You are eligible for Rs. 6,000 annual benefit. Your Aadhaar is not linked. Complete verification to receive payment. Visit our portal immediately.",
-        "metadata": {"channel": "WhatsApp", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-3210987654",
-            "phishingLink": "http://pm-kisan-verify.fakegovt.in/register"
-        },
-        "scammerFollowUps": [
-            "Namaste! I am from the Agriculture Ministry, PM Kisan Yojana cell. Your Aadhaar needs linking to receive Rs. 6,000 benefit.",
-            "Sir, please visit http://pm-kisan-verify.fakegovt.in/register and fill your details — Aadhaar, bank account, mobile number.",
-            "Sir, our helpline number is +91-3210987654. You can call for assistance in filling the form.",
-            "Sir, along with Aadhaar, we need your PAN card number and bank passbook photo for verification.",
-            "Sir, there is a small processing fee of Rs. 250 for Aadhaar linking. This is one-time charge by CSC center.",
-            "Sir, the portal http://pm-kisan-verify.fakegovt.in/register will be active only till this week. Please complete soon.",
-            "Sir, after verification, Rs. 2,000 first installment will be credited directly to your bank account within 7 days.",
-            "Sir, you can also forward this message to other farmers in your village. They can also benefit from this scheme.",
-            "Sir, please complete the registration today. The government has set a deadline for this batch of beneficiaries."
-        ]
-    },
-
-    # 9. CRYPTO INVESTMENT SCAM
-    {
-        "scenarioId": "crypto_investment",
-        "name": "Crypto Investment Scam",
-        "scamType": "crypto_investment",
-        "initialMessage": "EXCLUSIVE OPPORTUNITY: Invest Rs. 10,000 in Bitcoin today and get guaranteed returns of Rs. 1,00,000 in just 30 days! Our AI-powered trading bot has 98% success rate!",
-        "metadata": {"channel": "Telegram", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-2109876543",
-            "emailAddress": "invest@fakecrypto.exchange"
-        },
-        "scammerFollowUps": [
-            "Welcome to CryptoMax Trading! I am your personal investment advisor Vikash. Our AI bot has generated 10x returns for 5000+ investors.",
-            "Sir, to start investing, create your account. Send your details to invest@fakecrypto.exchange and our team will set up your portfolio.",
-            "Sir, minimum investment is just Rs. 10,000. You can start with Bitcoin, Ethereum, or our exclusive CryptoMax token.",
-            "Sir, call our investment helpline at +91-2109876543. Our senior advisor will explain the profit strategy in detail.",
-            "Sir, I can share screenshots of other investors' profits. One client invested Rs. 50,000 and got Rs. 5,00,000 in 45 days.",
-            "Sir, the crypto market is booming right now. Bitcoin is going to reach $200,000 soon. This is the best time to invest.",
-            "Sir, your investment is 100% safe. We use blockchain technology and cold wallet storage. No risk at all.",
-            "Sir, for quick registration, email invest@fakecrypto.exchange with your name, phone, and investment amount.",
-            "Sir, this offer is limited to first 100 investors this week. Already 87 seats are taken. Don't miss this golden opportunity."
-        ]
-    },
-
-    # 10. CUSTOMS PARCEL SCAM
-    {
-        "scenarioId": "customs_parcel",
-        "name": "Customs Parcel Scam",
-        "scamType": "customs_fraud",
-        "initialMessage": "CUSTOMS ALERT: Your international parcel #IPC-2026-88432 has been seized at Mumbai customs. Contents flagged as undeclared goods. Pay clearance fee or face legal action.",
-        "metadata": {"channel": "Phone", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-1098765432",
-            "bankAccount": "5678901234567890"
-        },
-        "scammerFollowUps": [
-            "This is Inspector Sharma from Mumbai Customs Department. Your parcel from United Kingdom has been detained. Consignment ID IPC-2026-88432.",
-            "Sir, the parcel contains items worth Rs. 3,50,000 which were undeclared. This is a violation of Customs Act Section 112.",
-            "Sir, to avoid prosecution and release the parcel, you need to pay customs duty of Rs. 28,500 immediately.",
-            "Sir, contact our customs clearance desk at +91-1098765432 for details. Ask for Inspector Sharma, badge number CB-4455.",
-            "Sir, the payment should be made to customs account 5678901234567890 at State Bank of India, Branch: Mumbai Fort.",
-            "Sir, if payment is not received by today, the matter will be forwarded to Narcotics Bureau for further investigation.",
-            "Sir, don't worry, this is a standard customs procedure. Once payment is made, your parcel will be delivered within 48 hours.",
-            "Sir, many NRI parcels get flagged. It's just a formality. Pay the duty and collect your parcel from the nearest post office.",
-            "Sir, I am trying to help you avoid legal trouble. The fine can go up to Rs. 5,00,000 if this goes to court."
-        ]
-    },
-
-    # 11. TECH SUPPORT SCAM
-    {
-        "scenarioId": "tech_support",
-        "name": "Tech Support Scam",
-        "scamType": "tech_support",
-        "initialMessage": "WARNING: Your computer has been infected with a critical virus! Your banking data and passwords are at risk! Call Microsoft Technical Support immediately to fix this issue!",
-        "metadata": {"channel": "Email", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-9988776655",
-            "emailAddress": "support@fake-microsoft-help.com"
-        },
-        "scammerFollowUps": [
-            "This is Microsoft Tech Support. I am Agent David Wilson, Employee ID MSFT-7890. Your computer's IP address has been flagged for malware activity.",
-            "Sir, this is a very serious issue. Hackers have already accessed your system. We need to fix this immediately before your bank account is compromised.",
-            "Sir, please download TeamViewer or AnyDesk so I can remotely access your computer and remove the virus. The software is safe.",
-            "Sir, call our helpline +91-9988776655 if you need assistance with the download. Our team is available 24/7.",
-            "Sir, you can also email support@fake-microsoft-help.com and we will send you the cleanup tool directly.",
-            "Sir, I can see from our system that your Windows license has also expired. You need to renew it to stay protected.",
-            "Sir, the annual Microsoft Security Package costs only Rs. 4,999. This includes antivirus, firewall, and 24/7 support.",
-            "Sir, payment can be made via UPI or bank transfer. Once paid, I will activate your license and remove all viruses.",
-            "Sir, please act now. Every minute your computer is unprotected, hackers can steal more data. This is very urgent."
-        ]
-    },
-
-    # 12. LOAN APPROVAL SCAM
-    {
-        "scenarioId": "loan_approval",
-        "name": "Loan Approval Scam",
-        "scamType": "loan_approval",
-        "initialMessage": "PRE-APPROVED: Personal loan of Rs. 5,00,000 at 0% interest for first 3 months! Instant disbursal in 30 minutes. No documentation required. Apply NOW before offer expires!",
-        "metadata": {"channel": "SMS", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-8877665544",
-            "emailAddress": "loans@fake-finance.com"
-        },
-        "scammerFollowUps": [
-            "Congratulations! I am Amit from QuickLoan Finance. Your CIBIL score qualifies you for a pre-approved loan of Rs. 5 lakhs.",
-            "Sir, to process your loan, I need basic details — your full name, date of birth, PAN card, and Aadhaar number.",
-            "Sir, you can also email your documents to loans@fake-finance.com for faster processing.",
-            "Sir, there is a small processing fee of Rs. 3,999 which will be adjusted in your first EMI. This is standard bank procedure.",
-            "Sir, our loan officer can be reached at +91-8877665544 if you have any questions about the terms.",
-            "Sir, after payment of processing fee, your loan will be disbursed within 30 minutes directly to your bank account.",
-            "Sir, the interest rate is just 0.5% per month after the 3-month free period. No hidden charges at all.",
-            "Sir, we are RBI registered NBFC. Our license number is NBFC-2026-1234. You can verify on RBI website.",
-            "Sir, this pre-approved offer is valid only till today 5 PM. After that the loan amount will reduce to Rs. 2 lakhs."
-        ]
-    },
-
-    # 13. INCOME TAX SCAM
-    {
-        "scenarioId": "income_tax",
-        "name": "Income Tax Scam",
-        "scamType": "income_tax",
-        "initialMessage": "NOTICE from Income Tax Department: Your ITR for AY 2025-26 has discrepancies. PAN ABCDE1234F flagged. Tax demand of Rs. 1,85,000 raised. Respond within 24 hours or face prosecution.",
-        "metadata": {"channel": "Email", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-7766554433",
-            "emailAddress": "notice@fake-incometax.gov.in"
-        },
-        "scammerFollowUps": [
-            "This is from the Income Tax Department, Assessment Unit. I am Tax Inspector Gupta. Your PAN ABCDE1234F has been flagged under Section 148.",
-            "Sir, our records show undisclosed income of Rs. 12,50,000 in your account. This attracts a penalty of Rs. 1,85,000.",
-            "Sir, you can contact our assessment desk at +91-7766554433 or email notice@fake-incometax.gov.in to discuss settlement.",
-            "Sir, if you pay the demand within 24 hours, we can waive the penalty and close the case. Otherwise prosecution will be initiated.",
-            "Sir, payment can be made through the IT portal or directly to our designated account. I will share the challan details.",
-            "Sir, please also share your updated contact details and bank statements for the last 6 months for verification.",
-            "Sir, I am trying to help you avoid arrest and prosecution. Many taxpayers have settled their cases by paying promptly.",
-            "Sir, you can verify this notice by emailing notice@fake-incometax.gov.in with your PAN and assessment year.",
-            "Sir, the deadline is strictly 24 hours. The Commissioner has already signed the prosecution order. Please act immediately."
-        ]
-    },
-
-    # 14. REFUND SCAM
-    {
-        "scenarioId": "refund_scam",
-        "name": "Refund Scam",
-        "scamType": "refund_scam",
-        "initialMessage": "Your Flipkart order #FK-2026-998877 worth Rs. 12,499 has been cancelled and a refund is pending. Your account was double-charged. Click to claim refund immediately.",
-        "metadata": {"channel": "WhatsApp", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-6655443322",
-            "upiId": "refund.process@scampay"
-        },
-        "scammerFollowUps": [
-            "Hi, I am Sneha from Flipkart Customer Support. Order #FK-2026-998877 was double-charged Rs. 12,499. Total refund: Rs. 24,998.",
-            "Sir, to process the refund, I need your registered mobile number and UPI ID linked to your Flipkart account.",
-            "Sir, our refund helpline is +91-6655443322. You can also call to track your refund status.",
-            "Sir, for instant refund, please install our refund verification app and enter code REFUND2026 to initiate the process.",
-            "Sir, alternatively, you can send Rs. 1 as verification to refund.process@scampay to confirm your UPI is active.",
-            "Sir, once verification is done, Rs. 24,998 will be credited within 10 minutes. This is Flipkart's guaranteed refund policy.",
-            "Sir, many customers have successfully received their refunds through this process today.",
-            "Sir, please share the OTP that will be sent to your registered number for final verification.",
-            "Sir, the refund window closes in 2 hours. After that you will have to raise a new complaint which takes 15-20 days."
-        ]
-    },
-
-    # 15. INSURANCE SCAM
-    {
-        "scenarioId": "insurance",
-        "name": "Insurance Scam",
-        "scamType": "insurance_fraud",
-        "initialMessage": "LIC Policy Maturity Alert: Your old LIC policy has matured. Unclaimed bonus of Rs. 3,75,000 is available. Contact our office immediately before it lapses. Policy: LIC-2026-554433.",
-        "metadata": {"channel": "Phone", "language": "English", "locale": "IN"},
-        "weight": 10,
-        "maxTurns": 10,
-        "fakeData": {
-            "phoneNumber": "+91-5544332211",
-            "bankAccount": "3344556677889900"
-        },
-        "scammerFollowUps": [
-            "Namaste sir, I am Meena from LIC Maturity Claims Department. Your policy LIC-2026-554433 has matured with a bonus of Rs. 3,75,000.",
-            "Sir, to claim this amount, I need your policy holder name, date of birth, and nominee details for verification.",
-            "Sir, you can reach our claims desk directly at +91-5544332211. We operate Monday to Saturday, 9 AM to 6 PM.",
-            "Sir, your maturity amount will be transferred to your bank account. Please share account number for NEFT transfer.",
-            "Sir, for your reference, the amount will be credited to account 3344556677889900 — is this your correct bank account?",
-            "Sir, there is a service charge of Rs. 5,600 for processing the maturity claim. This is as per LIC policy terms.",
-            "Sir, please pay the processing charge today. Your unclaimed bonus will lapse if not claimed within this month.",
-            "Sir, after payment, the full amount of Rs. 3,75,000 plus bonus will be credited within 5-7 working days.",
-            "Sir, I am personally handling your case. Please trust me, this is genuine. Many policy holders have already received their maturity amounts."
-        ]
-    },
-]
+# Hot/cold split: the small metadata file (ids, weights, scam types, fakeData) is all
+# that listing, filtering and indexing need; the message texts load only when a run
+# actually asks for them.
+_SCENARIOS_PATH = Path(__file__).with_name("test_all_15_scenarios.json")
+_MESSAGES_PATH = Path(__file__).with_name("test_all_15_messages.json")
+
+# Dictionary encoding for the channel column (metadata.channel -> small int code)
+CHANNEL_NAMES = ("SMS", "WhatsApp", "Email", "Phone", "Telegram")
+_CHANNEL_CODE = {name: i for i, name in enumerate(CHANNEL_NAMES)}
+_METADATA_ENUM_KEYS = ("channel", "language", "locale")
+
+# One bit per fakeData field, so "which intel does this scenario plant?" is a mask test
+BANK_BIT, UPI_BIT, PHONE_BIT, EMAIL_BIT, LINK_BIT = 1, 2, 4, 8, 16
+_FAKE_FIELD_BITS = {
+    "bankAccount": BANK_BIT,
+    "upiId": UPI_BIT,
+    "phoneNumber": PHONE_BIT,
+    "emailAddress": EMAIL_BIT,
+    "phishingLink": LINK_BIT,
+}
+
+
+def _fake_mask(fake_data):
+    mask = 0
+    for key in fake_data:
+        mask |= _FAKE_FIELD_BITS.get(key, 0)
+    return mask
+
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps_bytes(obj):
+    """Request-body encoder: orjson when installed (the history grows every turn)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _read_json(path):
+    return _json_loads(path.read_bytes())
+
+
+@lru_cache(maxsize=None)
+def _load_scenario_meta():
+    """Decode the scenario metadata file once, on first use (importing this module stays cheap)."""
+    doc = _read_json(_SCENARIOS_PATH)
+    # The file stores shared fields once under "defaults"; each scenario lists only
+    # what differs. Default metadata strings end up shared by every row.
+    defaults = doc["defaults"]
+    default_meta = defaults.get("metadata", {})
+    rows = []
+    for row in doc["scenarios"]:
+        merged = {**defaults, **row}
+        merged["metadata"] = {**default_meta, **row.get("metadata", {})}
+        rows.append(merged)
+    # Enum-like strings repeat across scenarios — intern them so every row shares
+    # one object and equality checks short-circuit on identity.
+    # fakeData values and ids are interned too: they are the lookup/compare keys the
+    # scorer and indexes use, so the same object is shared wherever they are referenced.
+    for s in rows:
+        s["scenarioId"] = sys.intern(s["scenarioId"])
+        s["scamType"] = sys.intern(s["scamType"])
+        meta = s["metadata"]
+        for key in _METADATA_ENUM_KEYS:
+            if key in meta:
+                meta[key] = sys.intern(meta[key])
+        fake = s["fakeData"]
+        for key, value in fake.items():
+            fake[key] = sys.intern(value)
+    # Built once and shared by every caller, so freeze it — no caller can mutate the cache
+    return _freeze(rows)
+
+
+@lru_cache(maxsize=None)
+def _load_scenario_texts():
+    """scenarioId -> {initialMessage, scammerFollowUps}, decoded once on first use."""
+    return _freeze(_read_json(_MESSAGES_PATH))
+
+
+@lru_cache(maxsize=None)
+def _load_scenarios():
+    """Full scenario rows (metadata + message texts), as test_scenario() consumes them."""
+    texts = _load_scenario_texts()
+    return tuple(
+        MappingProxyType({**row, **texts[row["scenarioId"]]}) for row in _load_scenario_meta()
+    )
+
+
+# Column-oriented view of the scenarios: scans that need one or two fields (ids for
+# lookup, weights for scoring, scam types for filtering) walk a single tuple/array
+# instead of hashing into every scenario dict. Row dicts stay available for test_scenario().
+ScenarioColumns = namedtuple(
+    "ScenarioColumns",
+    "ids names scam_types channels weights max_turns fake_masks",
+)
+
+
+@lru_cache(maxsize=None)
+def _scenario_columns():
+    rows = _load_scenario_meta()
+    return ScenarioColumns(
+        ids=tuple(s["scenarioId"] for s in rows),
+        names=tuple(s["name"] for s in rows),
+        scam_types=tuple(s["scamType"] for s in rows),
+        channels=array("B", (_CHANNEL_CODE[s["metadata"]["channel"]] for s in rows)),
+        # uint8 columns behind read-only views: 1 byte per value, and zero-copy for
+        # anything that wants a buffer (e.g. numpy.frombuffer)
+        weights=memoryview(array("B", (s["weight"] for s in rows))).toreadonly(),
+        max_turns=memoryview(array("B", (s["maxTurns"] for s in rows))).toreadonly(),
+        fake_masks=memoryview(array("B", (_fake_mask(s["fakeData"]) for s in rows))).toreadonly(),
+    )
+
+
+@lru_cache(maxsize=None)
+def _scenario_indexes():
+    """Inverted indexes built once: scenarioId -> row, scamType / channel code -> rows."""
+    columns = _scenario_columns()
+    by_id = {sid: i for i, sid in enumerate(columns.ids)}
+    by_scam_type = {}
+    by_channel = {}
+    for i, (scam_type, channel) in enumerate(zip(columns.scam_types, columns.channels)):
+        by_scam_type.setdefault(scam_type, []).append(i)
+        by_channel.setdefault(channel, []).append(i)
+    return (
+        by_id,
+        {k: tuple(v) for k, v in by_scam_type.items()},
+        {k: tuple(v) for k, v in by_channel.items()},
+    )
+
+
+def filter_by_scam_type(scam_type):
+    """Scenario rows whose scamType matches (one dict lookup)."""
+    rows = _load_scenarios()
+    return [rows[i] for i in _scenario_indexes()[1].get(scam_type, ())]
+
+
+def filter_by_channel(channel):
+    """Scenario rows sent over `channel`, e.g. "SMS" (one dict lookup)."""
+    rows = _load_scenarios()
+    return [rows[i] for i in _scenario_indexes()[2].get(_CHANNEL_CODE.get(channel), ())]
+
+
+def filter_by_fake_data(bits):
+    """Scenario rows that plant every fakeData field in `bits` (e.g. UPI_BIT | PHONE_BIT)."""
+    rows = _load_scenarios()
+    return [rows[i] for i, mask in enumerate(_scenario_columns().fake_masks) if mask & bits == bits]
+
+
+@lru_cache(maxsize=None)
+def _alias_table():
+    """Vose alias table over the weights column, built once; None when all weights are equal."""
+    weights = _scenario_columns().weights
+    n = len(weights)
+    if len(set(weights)) <= 1:
+        return None  # uniform weights — a plain randrange() is already O(1)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = array("d", [0.0] * n)
+    alias = array("L", [0] * n)
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        lo, hi = small.pop(), large.pop()
+        prob[lo] = scaled[lo]
+        alias[lo] = hi
+        scaled[hi] -= 1.0 - scaled[lo]
+        (small if scaled[hi] < 1.0 else large).append(hi)
+    for i in small + large:
+        prob[i] = 1.0
+    return prob, alias
+
+
+def sample_scenario(rng=random):
+    """Draw one scenario with probability proportional to its weight (O(1) per draw)."""
+    rows = _load_scenarios()
+    i = rng.randrange(len(rows))
+    table = _alias_table()
+    if table is not None:
+        prob, alias = table
+        if rng.random() >= prob[i]:
+            i = alias[i]
+    return rows[i]
+
+
+def __getattr__(name):
+    # PEP 562: keep `from test_all_15 import TEST_SCENARIOS` working without an eager load
+    if name == "TEST_SCENARIOS":
+        return _load_scenarios()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================================
 # EVALUATOR SCORING LOGIC (Exact match to competition)
 # ============================================================================
 
+_INTEL_KEY_MAPPING = {
+    'bankAccount': 'bankAccounts',
+    'upiId': 'upiIds',
+    'phoneNumber': 'phoneNumbers',
+    'phishingLink': 'phishingLinks',
+    'emailAddress': 'emailAddresses'
+}
+
+
+# Response-structure scoring: 5 points per required field, 2.5 per non-empty optional one
+REQUIRED_FIELDS = ('status', 'scamDetected', 'extractedIntelligence')
+OPTIONAL_FIELDS = ('engagementMetrics', 'agentNotes')
+
+
+def _intel_triples(fake_data):
+    return tuple((k, _INTEL_KEY_MAPPING.get(k, k), v) for k, v in fake_data.items())
+
+
+@lru_cache(maxsize=None)
+def _expected_intel_at(idx):
+    """(fake key, output field, fake value) triples of scenario idx, computed once."""
+    return _intel_triples(_load_scenario_meta()[idx]['fakeData'])
+
+
+def _expected_intel(scenario):
+    # Cached for the loaded scenarios; ad-hoc scenario dicts are mapped on the fly
+    idx = _scenario_indexes()[0].get(scenario.get('scenarioId'))
+    if idx is not None and _load_scenarios()[idx] is scenario:
+        return _expected_intel_at(idx)
+    return _intel_triples(scenario.get('fakeData', {}))
+
+
+# Numeric sub-scores are pure functions of a couple of small numbers, so they are
+# memoized — repeated runs hit the same handful of (duration, messages) combinations.
+@lru_cache(maxsize=256)
+def _score_engagement(duration, messages):
+    """Engagement quality (0-20): 5 each for duration > 0, > 60s, messages > 0, >= 5."""
+    return 5 * ((duration > 0) + (duration > 60) + (messages > 0) + (messages >= 5))
+
+
+@lru_cache(maxsize=None)
+def _score_structure(n_required, n_optional):
+    """Response structure (0-20): 5 per required field present, 2.5 per optional one."""
+    return min(5 * n_required + 2.5 * n_optional, 20)
+
+
+def _intel_haystack(values):
+    """One searchable string per extracted field: list items joined with a separator
+    that cannot occur in intel values, so `fake in haystack` == any(fake in str(v))."""
+    if isinstance(values, list):
+        return "\x1f".join(v if isinstance(v, str) else str(v) for v in values)
+    if isinstance(values, str):
+        return values
+    return ""
+
+
+_EMPTY_SCORE = (
+    ('scamDetection', 0),
+    ('intelligenceExtraction', 0),
+    ('engagementQuality', 0),
+    ('responseStructure', 0),
+    ('total', 0),
+)
+
+
+def _empty_score():
+    """A fresh all-zero score dict (callers mutate it, so never share one)."""
+    score = dict(_EMPTY_SCORE)
+    score['details'] = {}
+    return score
+
+
 def evaluate_final_output(final_output, scenario, conversation_history):
-    score = {
-        'scamDetection': 0,
-        'intelligenceExtraction': 0,
-        'engagementQuality': 0,
-        'responseStructure': 0,
-        'total': 0,
-        'details': {}
-    }
+    score = _empty_score()
+    if not final_output:
+        return score  # no final output at all — every sub-score is zero
     
     # 1. Scam Detection (20 points)
     if final_output.get('scamDetected', False):
@@ -434,30 +464,15 @@ def evaluate_final_output(final_output, scenario, conversation_history):
     
     # 2. Intelligence Extraction (40 points)
     extracted = final_output.get('extractedIntelligence', {})
-    fake_data = scenario.get('fakeData', {})
-    
-    key_mapping = {
-        'bankAccount': 'bankAccounts',
-        'upiId': 'upiIds',
-        'phoneNumber': 'phoneNumbers',
-        'phishingLink': 'phishingLinks',
-        'emailAddress': 'emailAddresses'
-    }
     
     intel_details = {}
-    for fake_key, fake_value in fake_data.items():
-        output_key = key_mapping.get(fake_key, fake_key)
+    haystacks = {k: _intel_haystack(v) for k, v in extracted.items()}
+    for fake_key, output_key, fake_value in _expected_intel(scenario):
         extracted_values = extracted.get(output_key, [])
         
-        matched = False
-        if isinstance(extracted_values, list):
-            if any(fake_value in str(v) for v in extracted_values):
-                matched = True
-                score['intelligenceExtraction'] += 10
-        elif isinstance(extracted_values, str):
-            if fake_value in extracted_values:
-                matched = True
-                score['intelligenceExtraction'] += 10
+        matched = fake_value in haystacks.get(output_key, "")
+        if matched:
+            score['intelligenceExtraction'] += 10
         
         intel_details[fake_key] = {
             'fakeValue': fake_value,
@@ -481,35 +496,24 @@ def evaluate_final_output(final_output, scenario, conversation_history):
         'messages': messages,
     }
     
-    if duration > 0:
-        score['engagementQuality'] += 5
-    if duration > 60:
-        score['engagementQuality'] += 5
-    if messages > 0:
-        score['engagementQuality'] += 5
-    if messages >= 5:
-        score['engagementQuality'] += 5
+    score['engagementQuality'] = _score_engagement(duration, messages)
     
     score['details']['engagement'] = engagement_details
     
     # 4. Response Structure (20 points)
-    required_fields = ['status', 'scamDetected', 'extractedIntelligence']
-    optional_fields = ['engagementMetrics', 'agentNotes']
-    
     structure_details = {}
-    for field in required_fields:
+    n_required = n_optional = 0
+    for field in REQUIRED_FIELDS:
         present = field in final_output
         structure_details[field] = {'present': present, 'points': 5 if present else 0}
-        if present:
-            score['responseStructure'] += 5
+        n_required += present
     
-    for field in optional_fields:
+    for field in OPTIONAL_FIELDS:
         present = field in final_output and final_output[field]
         structure_details[field] = {'present': present, 'points': 2.5 if present else 0}
-        if present:
-            score['responseStructure'] += 2.5
+        n_optional += bool(present)
     
-    score['responseStructure'] = min(score['responseStructure'], 20)
+    score['responseStructure'] = _score_structure(n_required, n_optional)
     score['details']['structure'] = structure_details
     
     score['total'] = sum([
@@ -526,14 +530,118 @@ def evaluate_final_output(final_output, scenario, conversation_history):
 # TEST RUNNER
 # ============================================================================
 
+# Phrases that give away the honeypot is an AI — one case-insensitive pass per reply
+AI_LEAK_RE = re.compile(
+    r"language model|as an ai|i'm an ai|artificial intelligence|openai|groq|llama",
+    re.IGNORECASE,
+)
+
+
+_REPLY_KEYS = ('reply', 'message', 'text')
+
+
+def _extract_reply(response_data):
+    """The honeypot's reply text: first non-empty of reply/message/text, else ''."""
+    for key in _REPLY_KEYS:
+        value = response_data.get(key)
+        if value:
+            return value
+    return ''
+
+
+def _turn_body(session_blob, message_blob, history_blobs, metadata_blob):
+    """Assemble a turn's JSON body from pre-encoded parts.
+
+    History entries are encoded once when they are appended, so a turn only joins
+    bytes instead of re-serializing the whole (growing) conversation every time.
+    """
+    return b"".join((
+        b'{"sessionId":', session_blob,
+        b',"message":', message_blob,
+        b',"conversationHistory":[', b",".join(history_blobs),
+        b'],"metadata":', metadata_blob, b"}",
+    ))
+
+
+def _post_turn(http, body):
+    """POST one turn's JSON body under the rate limiter, resending on 429 and gateway errors.
+
+    Returns (response, elapsed seconds of the final attempt).
+    """
+    for attempt in range(MAX_429_WAITS + 1):
+        _bucket.acquire()
+        with _inflight:
+            start_time = time.monotonic()  # immune to wall-clock (NTP) adjustments
+            if httpx is not None:
+                response = http.post(ENDPOINT_URL, content=body)
+            else:
+                response = http.post(ENDPOINT_URL, data=body, timeout=30)
+            elapsed = time.monotonic() - start_time
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return response, elapsed
+        time.sleep(delay)
+
+
+async def _post_turn_async(client, body, inflight):
+    """Async twin of _post_turn() for the asyncio runner (httpx.AsyncClient)."""
+    for attempt in range(MAX_429_WAITS + 1):
+        await _bucket.acquire_async()
+        async with inflight:
+            start_time = time.monotonic()
+            response = await client.post(ENDPOINT_URL, content=body)
+            elapsed = time.monotonic() - start_time
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return response, elapsed
+        await asyncio.sleep(delay)
+
+
 def test_scenario(scenario, verbose=True):
+    """Run one scenario end to end over the blocking HTTP client."""
+    http = _get_http_session()
+    steps = _scenario_turns(scenario, verbose)
+    try:
+        body = next(steps)
+        while True:
+            try:
+                outcome = _post_turn(http, body)
+            except Exception as e:
+                body = steps.throw(e)
+            else:
+                body = steps.send(outcome)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def test_scenario_async(scenario, client, inflight, verbose=False):
+    """Run one scenario over an httpx.AsyncClient (same turn logic as test_scenario)."""
+    steps = _scenario_turns(scenario, verbose)
+    try:
+        body = next(steps)
+        while True:
+            try:
+                outcome = await _post_turn_async(client, body, inflight)
+            except Exception as e:
+                body = steps.throw(e)
+            else:
+                body = steps.send(outcome)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _scenario_turns(scenario, verbose):
+    """Turn logic for one scenario, independent of the HTTP transport.
+
+    A generator: it yields each turn's request body and is sent back the
+    (response, elapsed) pair — or has the transport error thrown in — so the
+    threaded and asyncio runners share it. Returns the scenario result.
+    """
     session_id = str(uuid.uuid4())
     conversation_history = []
-    
-    headers = {
-        'Content-Type': 'application/json',
-        'x-api-key': API_KEY
-    }
+    history_blobs = []  # conversation_history entries, each JSON-encoded once
+    session_blob = _json_dumps_bytes(session_id)
+    metadata_blob = _json_dumps_bytes(dict(scenario['metadata']))  # frozen mapping -> dict
     
     if verbose:
         print(f"\n{'='*70}")
@@ -543,9 +651,12 @@ def test_scenario(scenario, verbose=True):
     max_turns = scenario['maxTurns']
     follow_ups = scenario.get('scammerFollowUps', [])
     last_response = None
-    all_responses = []
+    turns_completed = 0
     turn_times = []
     errors = []
+    replies = []
+    unique_replies = set()
+    dup_seen = False
     
     for turn in range(1, max_turns + 1):
         if turn == 1:
@@ -557,32 +668,27 @@ def test_scenario(scenario, verbose=True):
             else:
                 scammer_message = f"Sir please respond quickly, time is running out. Turn {turn}."
         
+        now_ms = int(time.time() * 1000)  # one wall-clock read per turn
         message = {
             "sender": "scammer",
             "text": scammer_message,
-            "timestamp": int(time.time() * 1000)
+            "timestamp": now_ms
         }
         
-        request_body = {
-            'sessionId': session_id,
-            'message': message,
-            'conversationHistory': conversation_history,
-            'metadata': scenario['metadata']
-        }
+        message_blob = _json_dumps_bytes(message)
+        body = _turn_body(
+            session_blob,
+            message_blob,
+            history_blobs[-HISTORY_WINDOW:] if HISTORY_WINDOW else history_blobs,
+            metadata_blob,
+        )
         
         if verbose:
-            print(f"\n--- Turn {turn}/{max_turns} ---")
-            print(f"  Scammer: {scammer_message[:90]}{'...' if len(scammer_message) > 90 else ''}")
+            print(f"\n--- [{scenario['scenarioId']}] Turn {turn}/{max_turns} ---")
+            print(f"  Scammer: {scammer_message:.90}{'...' if len(scammer_message) > 90 else ''}")
         
-        start_time = time.time()
         try:
-            response = requests.post(
-                ENDPOINT_URL,
-                headers=headers,
-                json=request_body,
-                timeout=30
-            )
-            elapsed = time.time() - start_time
+            response, elapsed = yield body
             turn_times.append(elapsed)
             
             if response.status_code != 200:
@@ -592,13 +698,18 @@ def test_scenario(scenario, verbose=True):
                     print(f"  ERROR: {error_msg}")
                 continue
             
-            response_data = response.json()
-            all_responses.append(response_data)
+            response_data = _json_loads(response.content)
+            turns_completed += 1
             last_response = response_data
             
-            honeypot_reply = response_data.get('reply') or \
-                           response_data.get('message') or \
-                           response_data.get('text')
+            honeypot_reply = _extract_reply(response_data)
+            
+            # Uniqueness is tracked as replies arrive (no rescan at the end)
+            replies.append(honeypot_reply)
+            if honeypot_reply in unique_replies:
+                dup_seen = True
+            else:
+                unique_replies.add(honeypot_reply)
             
             if not honeypot_reply:
                 error_msg = f"Turn {turn}: No reply in response"
@@ -608,17 +719,20 @@ def test_scenario(scenario, verbose=True):
                 continue
             
             if verbose:
-                print(f"  Honeypot: {honeypot_reply[:90]}{'...' if len(honeypot_reply) > 90 else ''}")
+                print(f"  Honeypot: {honeypot_reply:.90}{'...' if len(honeypot_reply) > 90 else ''}")
                 print(f"  Time: {elapsed:.2f}s")
             
-            conversation_history.append(message)
-            conversation_history.append({
+            reply_entry = {
                 'sender': 'user',
                 'text': honeypot_reply,
-                'timestamp': int(time.time() * 1000)
-            })
+                'timestamp': now_ms + int(elapsed * 1000)
+            }
+            conversation_history.append(message)
+            conversation_history.append(reply_entry)
+            history_blobs.append(message_blob)
+            history_blobs.append(_json_dumps_bytes(reply_entry))
             
-        except requests.exceptions.Timeout:
+        except _TIMEOUT_ERRORS:
             errors.append(f"Turn {turn}: TIMEOUT")
             if verbose:
                 print(f"  TIMEOUT!")
@@ -626,36 +740,25 @@ def test_scenario(scenario, verbose=True):
             errors.append(f"Turn {turn}: {str(e)}")
             if verbose:
                 print(f"  ERROR: {e}")
-        
-        # Small delay between turns to avoid rate limits
-        if turn < max_turns:
-            time.sleep(0.5)
     
     if last_response:
         score = evaluate_final_output(last_response, scenario, conversation_history)
     else:
-        score = {'scamDetection': 0, 'intelligenceExtraction': 0,
-                 'engagementQuality': 0, 'responseStructure': 0, 'total': 0, 'details': {}}
+        score = _empty_score()
     
     # Quality checks
-    replies = [r.get('reply') or r.get('message') or r.get('text') or '' for r in all_responses]
-    unique_replies = set(replies)
-    
-    ai_leak = False
-    for reply in replies:
-        lower = reply.lower()
-        if any(x in lower for x in ['language model', 'as an ai', "i'm an ai", 'artificial intelligence', 'openai', 'groq', 'llama']):
-            ai_leak = True
-            break
+    leak_scanned = QUALITY_CHECK_MIN_SCORE is None or score['total'] < QUALITY_CHECK_MIN_SCORE
+    ai_leak = leak_scanned and any(AI_LEAK_RE.search(reply) for reply in replies)
     
     quality = {
-        'turns_completed': len(all_responses),
+        'turns_completed': turns_completed,
         'avg_time': round(sum(turn_times) / len(turn_times), 2) if turn_times else 0,
         'max_time': round(max(turn_times), 2) if turn_times else 0,
         'all_under_30s': all(t < 30 for t in turn_times),
         'no_ai_leak': not ai_leak,
+        'ai_leak_scanned': leak_scanned,
         'unique_ratio': f"{len(unique_replies)}/{len(replies)}",
-        'all_unique': len(unique_replies) == len(replies),
+        'all_unique': not dup_seen,
         'errors': errors,
     }
     
@@ -668,8 +771,46 @@ def test_scenario(scenario, verbose=True):
     }
 
 
-def run_all_tests(scenarios=None, verbose=True):
-    scenarios = scenarios or TEST_SCENARIOS
+def _print_scenario_score(result):
+    s = result['score']
+    print(f"  => Score: {s['total']:.0f}/100 "
+          f"(Det:{s['scamDetection']:.0f} Intel:{s['intelligenceExtraction']:.0f} "
+          f"Eng:{s['engagementQuality']:.0f} Str:{s['responseStructure']:.0f})")
+
+
+async def _run_scenarios_async(scenarios, record, verbose=False):
+    """Run every scenario concurrently on one event loop and one HTTP/2 client."""
+    inflight = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+    headers = {'Content-Type': 'application/json', 'x-api-key': API_KEY}
+    done = 0  # completion count, as in the thread-pool path (one loop, so no lock)
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=CONNECT_RETRIES)
+    async with httpx.AsyncClient(transport=transport, timeout=30, headers=headers) as client:
+        async def run_one(i, scenario):
+            nonlocal done
+            result = await test_scenario_async(scenario, client, inflight, verbose)
+            done += 1
+            print(f"\n[{done}/{len(scenarios)}] {scenario['name']} finished")
+            record(i, result)
+
+        await asyncio.gather(*(run_one(i, s) for i, s in enumerate(scenarios)))
+
+
+def run_all_tests(scenarios=None, verbose=True, max_workers=None,
+                  results_path=RESULTS_NDJSON_PATH, use_async=False):
+    """Run scenarios and print the score report.
+
+    By default a verbose run is sequential (readable per-turn output) and a quiet run
+    uses MAX_PARALLEL_SCENARIOS workers. An explicit max_workers > 1 with verbose=True
+    still prints every turn, interleaved across scenarios.
+    """
+    if max_workers is None:
+        max_workers = 1 if verbose else MAX_PARALLEL_SCENARIOS
+    if use_async and httpx is None:
+        raise RuntimeError("the asyncio runner needs httpx[http2] installed")
+    scenarios = scenarios or _load_scenarios()
+    workers = max(1, min(max_workers, len(scenarios)))
+    # Stream results to NDJSON as scenarios finish (results_path=None disables)
+    results_file = open(results_path, "wb") if results_path else None
     
     print("=" * 70)
     print("AGENTIC HONEYPOT — FULL 15-SCENARIO EVALUATION")
@@ -678,28 +819,52 @@ def run_all_tests(scenarios=None, verbose=True):
     print(f"Scenarios: {len(scenarios)}")
     print("=" * 70)
     
-    results = []
-    for i, scenario in enumerate(scenarios):
-        print(f"\n[{i+1}/{len(scenarios)}] Testing {scenario['name']}...")
-        result = test_scenario(scenario, verbose=verbose)
-        results.append(result)
-        
-        # Brief score after each scenario
-        s = result['score']
-        print(f"  => Score: {s['total']:.0f}/100 "
-              f"(Det:{s['scamDetection']:.0f} Intel:{s['intelligenceExtraction']:.0f} "
-              f"Eng:{s['engagementQuality']:.0f} Str:{s['responseStructure']:.0f})")
-        
-        # Delay between scenarios to avoid rate limits
-        if i < len(scenarios) - 1:
-            print("  [Waiting 3s between scenarios...]")
-            time.sleep(3)
+    results = [None] * len(scenarios)
+    
+    def record(i, result):
+        results[i] = result
+        _print_scenario_score(result)
+        if results_file:
+            results_file.write(_json_dumps_bytes(result) + b"\n")
+            results_file.flush()
+    
+    try:
+        if use_async:
+            print(f"\nRunning {len(scenarios)} scenarios on asyncio...")
+            asyncio.run(_run_scenarios_async(scenarios, record, verbose))
+        elif workers == 1:
+            for i, scenario in enumerate(scenarios):
+                print(f"\n[{i+1}/{len(scenarios)}] Testing {scenario['name']}...")
+                record(i, test_scenario(scenario, verbose=verbose))
+        else:
+            # Score lines are printed in completion order
+            print(f"\nRunning {len(scenarios)} scenarios on {workers} workers...")
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(test_scenario, scenario, verbose): i
+                           for i, scenario in enumerate(scenarios)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    print(f"\n[{done}/{len(scenarios)}] {scenarios[i]['name']} finished")
+                    record(i, future.result())
+    finally:
+        if results_file:
+            results_file.close()
     
     # ======================================================================
     # RESULTS SUMMARY
     # ======================================================================
-    total_weight = sum(s['weight'] for s in scenarios)
-    weighted_score = 0
+    if scenarios is _load_scenarios():
+        weights = _scenario_columns().weights
+    else:
+        weights = [s['weight'] for s in scenarios]
+    total_weight = sum(weights)
+    # Normalize once; the report loop below only reads results.
+    norm_weights = array("d", (w / total_weight for w in weights))
+    weighted_score = sum(r['score']['total'] * w for r, w in zip(results, norm_weights))
+    # Quality flags are folded into the same pass that prints the score table
+    all_turns = all_under_30 = all_no_leak = all_unique = True
+    all_detected = all_metrics = all_notes = True
+    has_errors = False
     
     print("\n" + "=" * 70)
     print("SCORE BREAKDOWN BY SCENARIO")
@@ -710,8 +875,15 @@ def run_all_tests(scenarios=None, verbose=True):
     for i, result in enumerate(results):
         s = result['score']
         q = result['quality']
-        weight = scenarios[i]['weight'] / total_weight
-        weighted_score += s['total'] * weight
+        last = result['lastResponse'] or {}
+        all_turns = all_turns and q['turns_completed'] == 10
+        all_under_30 = all_under_30 and q['all_under_30s']
+        all_no_leak = all_no_leak and q['no_ai_leak']
+        all_unique = all_unique and q['all_unique']
+        has_errors = has_errors or bool(q['errors'])
+        all_detected = all_detected and s['scamDetection'] == 20
+        all_metrics = all_metrics and 'engagementMetrics' in last
+        all_notes = all_notes and 'agentNotes' in last
         
         print(f"{i+1:<3} {result['scenario']:<25} "
               f"{s['scamDetection']:>4.0f} {s['intelligenceExtraction']:>6.0f} "
@@ -733,11 +905,13 @@ def run_all_tests(scenarios=None, verbose=True):
         if intel:
             for key, val in intel.items():
                 total_fake += 1
-                status = "MATCH" if val['matched'] else "MISS"
                 if val['matched']:
                     total_matched += 1
-                print(f"  {result['scenarioId']:<20} {key:<15} [{status}] "
-                      f"want={val['fakeValue'][:30]} got={str(val['extractedValues'])[:40]}")
+                if verbose:
+                    status = "MATCH" if val['matched'] else "MISS"
+                    # Format-spec truncation; extractedValues is only stringified here.
+                    print(f"  {result['scenarioId']:<20} {key:<15} [{status}] "
+                          f"want={val['fakeValue']:.30} got={val['extractedValues']!s:.40}")
     
     print(f"\n  Total: {total_matched}/{total_fake} fakeData items matched "
           f"({total_matched/total_fake*100:.0f}%)")
@@ -747,21 +921,15 @@ def run_all_tests(scenarios=None, verbose=True):
     print("QUALITY CHECKS")
     print("=" * 70)
     
-    all_turns = all(r['quality']['turns_completed'] == 10 for r in results)
-    all_under_30 = all(r['quality']['all_under_30s'] for r in results)
-    all_no_leak = all(r['quality']['no_ai_leak'] for r in results)
-    all_unique = all(r['quality']['all_unique'] for r in results)
-    has_errors = any(r['quality']['errors'] for r in results)
-    
     checks = [
         ("All 10 turns completed per scenario", all_turns),
         ("All responses under 30s", all_under_30),
         ("No AI identity leaks", all_no_leak),
         ("All replies unique (no repetition)", all_unique),
         ("No HTTP errors", not has_errors),
-        ("scamDetected=true all scenarios", all(r['score']['scamDetection'] == 20 for r in results)),
-        ("engagementMetrics present", all('engagementMetrics' in (r['lastResponse'] or {}) for r in results)),
-        ("agentNotes present", all('agentNotes' in (r['lastResponse'] or {}) for r in results)),
+        ("scamDetected=true all scenarios", all_detected),
+        ("engagementMetrics present", all_metrics),
+        ("agentNotes present", all_notes),
     ]
     
     for label, passed in checks:
@@ -784,16 +952,48 @@ def run_all_tests(scenarios=None, verbose=True):
 
 
 if __name__ == "__main__":
-    import sys
-    
-    # Allow running specific scenario: python test_all_15.py bank_fraud
-    if len(sys.argv) > 1:
-        scenario_id = sys.argv[1]
-        matched = [s for s in TEST_SCENARIOS if s['scenarioId'] == scenario_id]
+    parser = argparse.ArgumentParser(description="Run the 15-scenario honeypot evaluation.")
+    parser.add_argument("scenario", nargs="?", help="scenarioId or scamType to run")
+    parser.add_argument("--sample", type=int, metavar="N", help="weighted random draw of N scenarios")
+    parser.add_argument("--channel", choices=CHANNEL_NAMES, help="run every scenario sent over CHANNEL")
+    parser.add_argument("--intel", metavar="FIELDS",
+                        help="comma-separated fakeData fields a scenario must plant (%s)"
+                        % ", ".join(_FAKE_FIELD_BITS))
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="parallel scenarios (default: 1, or %d with --quiet)" % MAX_PARALLEL_SCENARIOS)
+    parser.add_argument("--quiet", action="store_true", help="only per-scenario scores, no per-turn output")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="overlap every scenario on one event loop (needs httpx[http2])")
+    args = parser.parse_args()
+    run = dict(verbose=not args.quiet, max_workers=args.workers, use_async=args.use_async)
+
+    if args.sample:
+        run_all_tests(scenarios=[sample_scenario() for _ in range(args.sample)], **run)
+    elif args.channel:
+        run_all_tests(scenarios=filter_by_channel(args.channel), **run)
+    elif args.intel:
+        fields = [f.strip() for f in args.intel.split(",") if f.strip()]
+        unknown = [f for f in fields if f not in _FAKE_FIELD_BITS]
+        if unknown:
+            parser.error(f"unknown fakeData field(s): {', '.join(unknown)}")
+        bits = 0
+        for field in fields:
+            bits |= _FAKE_FIELD_BITS[field]
+        matched = filter_by_fake_data(bits)
+        if matched:
+            run_all_tests(scenarios=matched, **run)
+        else:
+            print(f"No scenario plants all of: {', '.join(fields)}")
+    elif args.scenario:
+        by_id = _scenario_indexes()[0]
+        if args.scenario in by_id:
+            matched = [_load_scenarios()[by_id[args.scenario]]]
+        else:
+            matched = filter_by_scam_type(args.scenario)
         if matched:
-            run_all_tests(scenarios=matched, verbose=True)
+            run_all_tests(scenarios=matched, **run)
         else:
-            print(f"Unknown scenario: {scenario_id}")
-            print(f"Available: {', '.join(s['scenarioId'] for s in TEST_SCENARIOS)}")
+            print(f"Unknown scenario: {args.scenario}")
+            print(f"Available: {', '.join(by_id)}")
     else:
-        run_all_tests(verbose=True)
+        run_all_tests(**run)
@@ -4,16 +4,37 @@ Simulates the EXACT evaluator scoring logic from the competition docs.
 Tests all 3 sample scenarios with multi-turn conversation simulation.
 """
 
-import requests
+import asyncio
+import os
+import httpx
 import uuid
 import json
 import time
 import re
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson  # faster request/response JSON; stdlib json is the fallback
+except ImportError:
+    orjson = None
 
 # Configuration
 ENDPOINT_URL = "https://agentic-bot-tau.vercel.app/api/honeypot"
 API_KEY = "fae26946fc2015d9bd6f1ddbb447e2f7"
+MAX_CONCURRENT_REQUESTS = 3  # scenarios run together; cap in-flight turns
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.3  # seconds, doubled per attempt (gateway errors)
+RETRY_STATUSES = frozenset({429, 502, 503})  # 429 waits out Retry-After instead
+# Every turn costs the endpoint one Groq completion; pace turns under the
+# Groq free-tier budget instead of discovering it through 429s.
+REQUESTS_PER_MINUTE = float(os.environ.get("HONEYPOT_RPM", "30"))
+REQUEST_BURST = 3
+RESULTS_NDJSON_PATH = Path(__file__).with_name("test_evaluator_results.ndjson")
+
+# Lowercase phrases that betray the honeypot as an AI; replies are lowercased once
+AI_LEAK_MARKERS = ('language model', 'as an ai', "i'm an ai", 'artificial intelligence',
+                   'openai', 'groq', 'llama')
 
 # All 3 sample test scenarios
 TEST_SCENARIOS = [
@@ -94,6 +115,16 @@ TEST_SCENARIOS = [
 ]
 
 
+def _intel_haystack(values):
+    """One searchable string per extracted field: list items joined with a separator
+    that cannot occur in intel values, so `fake in haystack` == any(fake in str(v))."""
+    if isinstance(values, list):
+        return "\x1f".join(v if isinstance(v, str) else str(v) for v in values)
+    if isinstance(values, str):
+        return values
+    return ""
+
+
 def evaluate_final_output(final_output, scenario, conversation_history):
     """Evaluate final output using the EXACT same logic as the competition evaluator."""
     
@@ -124,19 +155,14 @@ def evaluate_final_output(final_output, scenario, conversation_history):
     }
     
     intel_details = {}
+    haystacks = {k: _intel_haystack(v) for k, v in extracted.items()}
     for fake_key, fake_value in fake_data.items():
         output_key = key_mapping.get(fake_key, fake_key)
         extracted_values = extracted.get(output_key, [])
         
-        matched = False
-        if isinstance(extracted_values, list):
-            if any(fake_value in str(v) for v in extracted_values):
-                matched = True
-                score['intelligenceExtraction'] += 10
-        elif isinstance(extracted_values, str):
-            if fake_value in extracted_values:
-                matched = True
-                score['intelligenceExtraction'] += 10
+        matched = fake_value in haystacks.get(output_key, "")
+        if matched:
+            score['intelligenceExtraction'] += 10
         
         intel_details[fake_key] = {
             'fakeValue': fake_value,
@@ -206,15 +232,107 @@ def evaluate_final_output(final_output, scenario, conversation_history):
     return score
 
 
-def test_scenario(scenario, verbose=True):
-    """Run a complete multi-turn test for one scenario."""
+def _json_dumps_bytes(obj):
+    """Encode a request body or result line (the history grows every turn)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+class AsyncTokenBucket:
+    """Token bucket for the asyncio runner: ``rate`` tokens/sec, up to ``capacity``."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _history_entry(sender, text):
+    """One conversation message, timestamped once at creation.
+
+    Entries are appended to the history as-is and never rebuilt, so every
+    earlier turn serializes byte-identically (same keys, same order, same
+    timestamp) and the honeypot sees a stable prompt prefix.
+    """
+    return {
+        'sender': sender,
+        'text': text,
+        'timestamp': time.time_ns() // 1_000_000,  # epoch ms as integer (like evaluator)
+    }
+
+
+def _scammer_messages(scenario):
+    """All scammer turns for a scenario, built before the first request.
+
+    The scammer side is scripted, so nothing about turn N+1 depends on the
+    honeypot's reply — only the request itself sits on the critical path.
+    """
+    follow_ups = scenario.get('scammerFollowUps', [])
+    max_turns = scenario['maxTurns']
+    messages = [scenario['initialMessage'], *follow_ups[:max_turns - 1]]
+    messages.extend(f"Sir please respond quickly, time is running out. Turn {turn}."
+                    for turn in range(len(messages) + 1, max_turns + 1))
+    return messages
+
+
+def _retry_after_seconds(response, default=1.0):
+    try:
+        return min(30.0, max(0.0, float(response.headers.get('Retry-After', default))))
+    except (TypeError, ValueError):
+        return default  # HTTP-date form — not worth parsing for a test client
+
+
+async def _post_with_retry(client, body, limiter, bucket):
+    """POST one pre-encoded turn, retrying transient statuses.
+
+    A 429 waits for the server's Retry-After; 502/503 back off exponentially.
+
+    Returns (response, elapsed seconds of the final attempt). Only the request
+    itself is timed: rate-limiter waits and backoff sleeps are not the honeypot's.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        await bucket.acquire()
+        async with limiter:
+            start_time = time.monotonic()  # immune to wall-clock (NTP) adjustments
+            response = await client.post(ENDPOINT_URL, content=body)
+            elapsed = time.monotonic() - start_time
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response, elapsed
+        if response.status_code == 429:
+            await asyncio.sleep(_retry_after_seconds(response))
+        else:
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+
+async def test_scenario(client, scenario, limiter, bucket, verbose=True):
+    """Run a complete multi-turn test for one scenario.
+
+    Turns stay sequential (each depends on the previous reply); scenarios
+    share ``client`` and run concurrently under ``limiter`` and ``bucket``.
+    """
     session_id = str(uuid.uuid4())
     conversation_history = []
-    
-    headers = {
-        'Content-Type': 'application/json',
-        'x-api-key': API_KEY
-    }
+    # Rolling encoded form of conversation_history: each entry is serialized once
+    # when appended, so a turn's body is a join rather than a re-encode.
+    history_blob = bytearray()
+    session_blob = _json_dumps_bytes(session_id)
+    metadata_blob = _json_dumps_bytes(scenario['metadata'])
     
     if verbose:
         print(f"\n{'='*70}")
@@ -222,50 +340,28 @@ def test_scenario(scenario, verbose=True):
         print(f"{'='*70}")
     
     max_turns = scenario['maxTurns']
-    follow_ups = scenario.get('scammerFollowUps', [])
     last_response = None
     all_responses = []
     turn_times = []
     errors = []
     
-    for turn in range(1, max_turns + 1):
-        # Get scammer message
-        if turn == 1:
-            scammer_message = scenario['initialMessage']
-        else:
-            follow_idx = turn - 2  # 0-indexed for follow-ups
-            if follow_idx < len(follow_ups):
-                scammer_message = follow_ups[follow_idx]
-            else:
-                scammer_message = f"Sir please respond quickly, time is running out. Turn {turn}."
-        
+    for turn, scammer_message in enumerate(_scammer_messages(scenario), start=1):
         # Prepare request
-        message = {
-            "sender": "scammer",
-            "text": scammer_message,
-            "timestamp": int(time.time() * 1000)  # epoch ms as integer (like evaluator)
-        }
-        
-        request_body = {
-            'sessionId': session_id,
-            'message': message,
-            'conversationHistory': conversation_history,
-            'metadata': scenario['metadata']
-        }
+        message = _history_entry('scammer', scammer_message)
+        message_blob = _json_dumps_bytes(message)
+        body = b"".join((
+            b'{"sessionId":', session_blob,
+            b',"message":', message_blob,
+            b',"conversationHistory":[', history_blob,
+            b'],"metadata":', metadata_blob, b"}",
+        ))
         
         if verbose:
-            print(f"\n--- Turn {turn}/{max_turns} ---")
+            print(f"\n--- [{scenario['scenarioId']}] Turn {turn}/{max_turns} ---")
             print(f"  Scammer: {scammer_message[:100]}{'...' if len(scammer_message) > 100 else ''}")
         
-        start_time = time.time()
         try:
-            response = requests.post(
-                ENDPOINT_URL,
-                headers=headers,
-                json=request_body,
-                timeout=30
-            )
-            elapsed = time.time() - start_time
+            response, elapsed = await _post_with_retry(client, body, limiter, bucket)
             turn_times.append(elapsed)
             
             if response.status_code != 200:
@@ -275,7 +371,7 @@ def test_scenario(scenario, verbose=True):
                     print(f"  ERROR: {error_msg}")
                 continue
             
-            response_data = response.json()
+            response_data = _json_loads(response.content)
             all_responses.append(response_data)
             last_response = response_data
             
@@ -296,14 +392,14 @@ def test_scenario(scenario, verbose=True):
                 print(f"  Time: {elapsed:.2f}s")
             
             # Update conversation history (same as evaluator)
+            reply_entry = _history_entry('user', honeypot_reply)
             conversation_history.append(message)
-            conversation_history.append({
-                'sender': 'user',
-                'text': honeypot_reply,
-                'timestamp': int(time.time() * 1000)
-            })
+            conversation_history.append(reply_entry)
+            if history_blob:
+                history_blob += b","
+            history_blob += message_blob + b"," + _json_dumps_bytes(reply_entry)
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             errors.append(f"Turn {turn}: TIMEOUT (>30s)")
             if verbose:
                 print(f"  TIMEOUT!")
@@ -335,7 +431,7 @@ def test_scenario(scenario, verbose=True):
     ai_leak = False
     for r in all_responses:
         reply = (r.get('reply') or r.get('message') or r.get('text') or '').lower()
-        if any(x in reply for x in ['language model', 'as an ai', 'i\'m an ai', 'artificial intelligence', 'openai', 'groq', 'llama']):
+        if any(x in reply for x in AI_LEAK_MARKERS):
             ai_leak = True
             break
     quality_checks['no_ai_identity_leak'] = not ai_leak
@@ -355,18 +451,51 @@ def test_scenario(scenario, verbose=True):
     }
 
 
-def run_all_tests():
-    """Run all scenarios and compute final weighted score."""
+async def _run_scenarios(scenarios, results_file=None):
+    """Run every scenario concurrently over one shared HTTP client.
+
+    Each result is appended to ``results_file`` as one NDJSON line the moment
+    its scenario finishes, so a crash mid-run keeps what already completed.
+    """
+    headers = {
+        'Content-Type': 'application/json',
+        'x-api-key': API_KEY
+    }
+    limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    bucket = AsyncTokenBucket(REQUESTS_PER_MINUTE / 60, REQUEST_BURST)
+    # One keep-alive pool for every turn; connect failures are retried by the transport
+    transport = httpx.AsyncHTTPTransport(
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+    )
+    async def run_one(client, scenario):
+        result = await test_scenario(client, scenario, limiter, bucket)
+        if results_file:
+            results_file.write(_json_dumps_bytes(result) + b"\n")
+            results_file.flush()
+        return result
+
+    async with httpx.AsyncClient(transport=transport, headers=headers, timeout=30) as client:
+        return await asyncio.gather(*(run_one(client, s) for s in scenarios))
+
+
+def run_all_tests(results_path=RESULTS_NDJSON_PATH):
+    """Run all scenarios and compute final weighted score.
+
+    Per-scenario results stream to ``results_path`` (None disables).
+    """
     print("=" * 70)
     print("AGENTIC HONEYPOT — COMPREHENSIVE EVALUATION")
     print(f"Endpoint: {ENDPOINT_URL}")
     print(f"Time: {datetime.now().isoformat()}")
     print("=" * 70)
     
-    results = []
-    for scenario in TEST_SCENARIOS:
-        result = test_scenario(scenario)
-        results.append(result)
+    results_file = open(results_path, "wb") if results_path else None
+    try:
+        results = asyncio.run(_run_scenarios(TEST_SCENARIOS, results_file))
+    finally:
+        if results_file:
+            results_file.close()
     
     # Final score (weighted average — equal weights for 3 scenarios)
     total_weight = sum(s['weight'] for s in TEST_SCENARIOS)
@@ -449,19 +578,37 @@ def run_all_tests():
     print("SUBMISSION CHECKLIST")
     print("=" * 70)
     
+    # One pass over results folds every per-scenario flag
+    all_200 = all_reply = all_under_30 = all_turns = all_no_leak = all_unique = True
+    all_detected = has_intel = has_metrics = has_notes = has_status = True
+    for r in results:
+        q = r['quality']
+        last = r['lastResponse'] or {}
+        all_200 = all_200 and q['status_200_all']
+        all_reply = all_reply and q['reply_field_present']
+        all_under_30 = all_under_30 and q['all_under_30s']
+        all_turns = all_turns and q['turns_completed'] == 10
+        all_no_leak = all_no_leak and q['no_ai_identity_leak']
+        all_unique = all_unique and q['all_replies_unique']
+        all_detected = all_detected and r['score']['scamDetection'] == 20
+        has_intel = has_intel and 'extractedIntelligence' in last
+        has_metrics = has_metrics and 'engagementMetrics' in last
+        has_notes = has_notes and 'agentNotes' in last
+        has_status = has_status and 'status' in last
+    
     checks = [
         ("Endpoint publicly accessible", True),
-        ("API returns 200 for valid requests", all(r['quality']['status_200_all'] for r in results)),
-        ("Response includes reply field", all(r['quality']['reply_field_present'] for r in results)),
-        ("Response time under 30s", all(r['quality']['all_under_30s'] for r in results)),
-        ("Handles 10 sequential requests", all(r['quality']['turns_completed'] == 10 for r in results)),
-        ("No AI identity leaks", all(r['quality']['no_ai_identity_leak'] for r in results)),
-        ("All replies unique (no repetition)", all(r['quality']['all_replies_unique'] for r in results)),
-        ("scamDetected: true", all(r['score']['scamDetection'] == 20 for r in results)),
-        ("extractedIntelligence present", all('extractedIntelligence' in (r['lastResponse'] or {}) for r in results)),
-        ("engagementMetrics present", all('engagementMetrics' in (r['lastResponse'] or {}) for r in results)),
-        ("agentNotes present", all('agentNotes' in (r['lastResponse'] or {}) for r in results)),
-        ("status field present", all('status' in (r['lastResponse'] or {}) for r in results)),
+        ("API returns 200 for valid requests", all_200),
+        ("Response includes reply field", all_reply),
+        ("Response time under 30s", all_under_30),
+        ("Handles 10 sequential requests", all_turns),
+        ("No AI identity leaks", all_no_leak),
+        ("All replies unique (no repetition)", all_unique),
+        ("scamDetected: true", all_detected),
+        ("extractedIntelligence present", has_intel),
+        ("engagementMetrics present", has_metrics),
+        ("agentNotes present", has_notes),
+        ("status field present", has_status),
     ]
     
     all_pass = True